@@ -25,8 +25,6 @@ Quick usage:
 from .kernel import TinyTalkKernel, RunResult
 from .runtime import ExecutionBounds, TinyTalkError
 from .types import Value, ValueType
-from .transpiler import transpile, transpile_pandas
-from .sql_transpiler import transpile_sql
 
 __version__ = "2.1.0"
 __all__ = [
@@ -40,3 +38,20 @@ __all__ = [
     "transpile_pandas",
     "transpile_sql",
 ]
+
+# The transpilers are only needed by callers that ask for them; load on first access.
+_LAZY_ATTRS = {
+    "transpile": ".transpiler",
+    "transpile_pandas": ".transpiler",
+    "transpile_sql": ".sql_transpiler",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
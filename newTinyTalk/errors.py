@@ -34,13 +34,20 @@ def find_closest(name: str, candidates: List[str], max_distance: int = 2) -> Opt
     """Find the closest match to `name` from a list of candidates."""
     if not candidates:
         return None
+    target = name.lower()
     best = None
     best_dist = max_distance + 1
     for c in candidates:
-        d = _edit_distance(name.lower(), c.lower())
+        lowered = c.lower()
+        # Edit distance is at least the length difference: skip hopeless candidates
+        if abs(len(lowered) - len(target)) >= best_dist:
+            continue
+        d = _edit_distance(target, lowered)
         if d < best_dist:
             best_dist = d
             best = c
+            if d == 0:
+                break
     return best if best_dist <= max_distance else None
 
 
@@ -18,7 +18,7 @@ from .runtime import Runtime, ExecutionBounds, TinyTalkError
 from .stdlib import set_output_buffer, clear_output_buffer
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResult:
     """Result of executing TinyTalk code."""
     success: bool
@@ -9,6 +9,8 @@ Two styles, one language:
 Both are first-class. Use whichever reads better for your code.
 """
 
+import re
+import sys
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import List, Any
@@ -186,7 +188,7 @@ class TokenType(Enum):
     ERROR = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     type: TokenType
     value: Any
@@ -199,6 +201,26 @@ class Token:
         return f"Token({self.type.name}, {self.value!r})"
 
 
+# Identifier tail: same set as str.isalnum() plus "_".
+_WORD_RE = re.compile(r"\w*")
+
+# Characters that end a run of plain string content, keyed by
+# (quote, raw, triple): the quote, "\\" and "{" unless raw, "\n" unless triple.
+_STRING_STOP_RE = {
+    (q, raw, triple): re.compile(
+        "[" + re.escape(q + ("" if raw else "\\{") + ("" if triple else "\n")) + "]")
+    for q in "\"'" for raw in (False, True) for triple in (False, True)
+}
+
+
+def _bucket_by_first(ops):
+    """Group (op, token_type) pairs by first char, keeping longest-first order."""
+    buckets = {}
+    for op, token_type in ops:
+        buckets.setdefault(op[0], []).append((op, token_type))
+    return {c: tuple(group) for c, group in buckets.items()}
+
+
 class Lexer:
     """Tokenizes TinyTalk source code."""
 
@@ -290,6 +312,10 @@ class Lexer:
         ("..", TokenType.RANGE),
     ]
 
+    # Same operators keyed by first character: _scan_token only tries the
+    # few that can match at the current position.
+    MULTI_OPS_BY_FIRST = _bucket_by_first(MULTI_OPS)
+
     SINGLE_OPS = {
         "+": TokenType.PLUS,
         "-": TokenType.MINUS,
@@ -318,6 +344,13 @@ class Lexer:
         "@": TokenType.AT,
     }
 
+    # Backslash escapes in string literals
+    ESCAPES = {
+        "n": "\n", "t": "\t", "r": "\r",
+        "\\": "\\", '"': '"', "'": "'",
+        "{": "{", "}": "}",
+    }
+
     STEP_KEYWORDS = {
         "_filter": TokenType.STEP_FILTER,
         "_sort": TokenType.STEP_SORT,
@@ -405,6 +438,21 @@ class Lexer:
             self.column += 1
         return c
 
+    def _skip_to(self, end: int):
+        """Jump to `end`, keeping line/column as repeated _advance() would."""
+        newlines = self.source.count("\n", self.pos, end)
+        if newlines:
+            self.line += newlines
+            self.column = end - self.source.rfind("\n", self.pos, end)
+        else:
+            self.column += end - self.pos
+        self.pos = end
+
+    def _skip_to_eol(self):
+        """Skip to (not past) the next newline."""
+        end = self.source.find("\n", self.pos)
+        self._skip_to(len(self.source) if end == -1 else end)
+
     def _skip_whitespace(self):
         while not self._at_end():
             c = self._peek()
@@ -420,20 +468,12 @@ class Lexer:
                 # At top level it's always a line comment.
                 if self._is_floor_div():
                     break
-                while not self._at_end() and self._peek() != "\n":
-                    self._advance()
+                self._skip_to_eol()
             elif c == "/" and self._peek(1) == "*":
-                self._advance()
-                self._advance()
-                while not self._at_end():
-                    if self._peek() == "*" and self._peek(1) == "/":
-                        self._advance()
-                        self._advance()
-                        break
-                    self._advance()
+                end = self.source.find("*/", self.pos + 2)
+                self._skip_to(len(self.source) if end == -1 else end + 2)
             elif c == "#":
-                while not self._at_end() and self._peek() != "\n":
-                    self._advance()
+                self._skip_to_eol()
             else:
                 break
 
@@ -444,8 +484,8 @@ class Lexer:
         start_col = self.column
 
         # Multi-char operators
-        for op, tt in self.MULTI_OPS:
-            if self.source[self.pos : self.pos + len(op)] == op:
+        for op, tt in self.MULTI_OPS_BY_FIRST.get(self.source[self.pos], ()):
+            if self.source.startswith(op, self.pos):
                 for _ in range(len(op)):
                     self._advance()
                 self.tokens.append(Token(tt, op, start_line, start_col))
@@ -508,8 +548,18 @@ class Lexer:
         parts: list = []  # list of (str_chunk, expr_tokens) pairs
         buf: list = []
         has_interp = False
+        stop = _STRING_STOP_RE[quote, raw, triple]
 
         while not self._at_end():
+            # Copy plain content up to the next quote/escape/brace/newline in one step
+            m = stop.search(self.source, self.pos)
+            end = m.start() if m else len(self.source)
+            if end > self.pos:
+                buf.append(self.source[self.pos:end])
+                self._skip_to(end)
+                if self._at_end():
+                    break
+
             c = self._peek()
 
             # End of string?
@@ -546,12 +596,7 @@ class Lexer:
                 if self._at_end():
                     break
                 escaped = self._advance()
-                escapes = {
-                    "n": "\n", "t": "\t", "r": "\r",
-                    "\\": "\\", '"': '"', "'": "'",
-                    "{": "{", "}": "}",
-                }
-                buf.append(escapes.get(escaped, escaped))
+                buf.append(self.ESCAPES.get(escaped, escaped))
             else:
                 buf.append(self._advance())
 
@@ -660,10 +705,15 @@ class Lexer:
         start_col = self.column
         start_pos = self.pos
 
-        while self._peek().isalnum() or self._peek() == "_":
-            self._advance()
+        # Identifiers never span lines, so one regex match replaces the
+        # per-character _peek/_advance loop.
+        end = _WORD_RE.match(self.source, self.pos).end()
+        self.column += end - self.pos
+        self.pos = end
 
-        text = self.source[start_pos : self.pos]
+        # Interned: scope dicts are keyed by these names, and identical
+        # objects let every variable lookup skip the string compare.
+        text = sys.intern(self.source[start_pos : self.pos])
 
         # Step keywords
         if text in self.STEP_KEYWORDS:
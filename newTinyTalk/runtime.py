@@ -9,12 +9,13 @@ Fixes from original:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Callable, Tuple
 import time
 import os
 import re as _re
 
-from .types import Value, ValueType
+from .types import Value, ValueType, NUMERIC_TYPES
 from .stdlib import format_value, BUILTIN_FUNCTIONS, STDLIB_CONSTANTS
 from .errors import (
     undefined_variable_hint, unknown_step_hint, step_type_mismatch_hint,
@@ -30,6 +31,13 @@ from .ast_nodes import (
 )
 
 
+@lru_cache(maxsize=256)
+def _wildcard_regex(pattern: str) -> "_re.Pattern":
+    """Compile an islike wildcard pattern (* and ?) once per distinct pattern."""
+    pattern = _re.escape(pattern).replace(r"\*", ".*").replace(r"\?", ".")
+    return _re.compile(pattern, _re.IGNORECASE)
+
+
 # ---------------------------------------------------------------------------
 # Control flow exceptions
 # ---------------------------------------------------------------------------
@@ -104,6 +112,7 @@ class TinyFunction:
     closure: Scope
     is_native: bool = False
     native_fn: Optional[Callable] = None
+    return_type: Optional[str] = None
 
 
 @dataclass
@@ -168,6 +177,7 @@ class Runtime:
         self.iteration_count = 0
         self.recursion_depth = 0
         self.start_time = 0.0
+        self._deadline = 0.0
 
         self._register_builtins()
 
@@ -234,6 +244,8 @@ class Runtime:
         self.iteration_count = 0
         self.recursion_depth = 0
         self.start_time = time.time()
+        # Monotonic deadline: one clock read and compare per op, immune to wall-clock jumps
+        self._deadline = time.monotonic() + self.bounds.timeout_seconds
         try:
             return self._eval(ast, self.global_scope)
         except ReturnException as e:
@@ -245,7 +257,7 @@ class Runtime:
         self.op_count += 1
         if self.op_count > self.bounds.max_ops:
             raise TinyTalkError(f"Exceeded max operations ({self.bounds.max_ops})")
-        if time.time() - self.start_time > self.bounds.timeout_seconds:
+        if time.monotonic() > self._deadline:
             raise TinyTalkError(f"Exceeded timeout ({self.bounds.timeout_seconds}s)")
 
     # -- eval dispatcher ----------------------------------------------------
@@ -362,8 +374,8 @@ class Runtime:
             raise ContinueException()
 
         if isinstance(node, FnDecl):
-            fn = TinyFunction(node.name, node.params, node.body, scope)
-            fn._return_type = getattr(node, 'return_type', None)
+            fn = TinyFunction(node.name, node.params, node.body, scope,
+                              return_type=node.return_type)
             scope.define(node.name, Value.function_val(fn), const=True)
             return Value.null_val()
 
@@ -518,10 +530,8 @@ class Runtime:
     def _eval_islike(self, left: Value, right: Value) -> Value:
         if left.type != ValueType.STRING or right.type != ValueType.STRING:
             return Value.bool_val(False)
-        pattern = _re.escape(right.data)
-        pattern = pattern.replace(r"\*", ".*").replace(r"\?", ".")
         try:
-            return Value.bool_val(bool(_re.fullmatch(pattern, left.data, _re.IGNORECASE)))
+            return Value.bool_val(bool(_wildcard_regex(right.data).fullmatch(left.data)))
         except Exception:
             return Value.bool_val(False)
 
@@ -632,8 +642,8 @@ class Runtime:
             except ReturnException as e:
                 result = e.value
             # Optional return type check
-            if hasattr(fn, '_return_type') and fn._return_type:
-                err = check_return_type(result, fn._return_type, fn.name)
+            if fn.return_type:
+                err = check_return_type(result, fn.return_type, fn.name)
                 if err:
                     raise TinyTalkError(err, line)
             return result
@@ -670,7 +680,8 @@ class Runtime:
         left = self._eval(node.left, scope)
         if isinstance(node.right, Call):
             fn_val = self._eval(node.right.callee, scope)
-            args = [left] + [self._eval(a, scope) for a in node.right.args]
+            args = [left]
+            args.extend(self._eval(a, scope) for a in node.right.args)
             return self._call_function(fn_val.data, args, scope, node.line)
         if isinstance(node.right, Identifier):
             fn_val = scope.get(node.right.name)
@@ -744,7 +755,7 @@ class Runtime:
                     return Value.float_val(float(obj.data)) if "." in obj.data else Value.int_val(int(obj.data))
                 except (ValueError, OverflowError):
                     return Value.int_val(0)
-            if obj.type in (ValueType.INT, ValueType.FLOAT):
+            if obj.type in NUMERIC_TYPES:
                 return obj
             return Value.int_val(0)
 
@@ -788,7 +799,7 @@ class Runtime:
                 return Value.int_val(int(float(obj.data)))
             except (ValueError, OverflowError):
                 return Value.int_val(0)
-        if obj.type in (ValueType.INT, ValueType.FLOAT):
+        if obj.type in NUMERIC_TYPES:
             return Value.int_val(int(obj.data))
         if obj.type == ValueType.BOOLEAN:
             return Value.int_val(1 if obj.data else 0)
@@ -800,7 +811,7 @@ class Runtime:
                 return Value.float_val(float(obj.data))
             except (ValueError, OverflowError):
                 return Value.float_val(0.0)
-        if obj.type in (ValueType.INT, ValueType.FLOAT):
+        if obj.type in NUMERIC_TYPES:
             return Value.float_val(float(obj.data))
         return Value.float_val(0.0)
 
@@ -1152,11 +1163,19 @@ class Runtime:
             return Value.int_val(len(items))
 
         if step == "_sum":
-            total = sum(item.data for item in items if item.type in (ValueType.INT, ValueType.FLOAT))
-            return Value.float_val(total) if any(item.type == ValueType.FLOAT for item in items) else Value.int_val(int(total))
+            # One pass: accumulate and note whether any float was seen
+            total = 0
+            has_float = False
+            for item in items:
+                if item.type == ValueType.INT:
+                    total += item.data
+                elif item.type == ValueType.FLOAT:
+                    total += item.data
+                    has_float = True
+            return Value.float_val(total) if has_float else Value.int_val(int(total))
 
         if step == "_avg":
-            nums = [item.data for item in items if item.type in (ValueType.INT, ValueType.FLOAT)]
+            nums = [item.data for item in items if item.type in NUMERIC_TYPES]
             return Value.float_val(sum(nums) / len(nums)) if nums else Value.null_val()
 
         if step == "_min":
@@ -1431,18 +1450,16 @@ class Runtime:
             idx_fn, col_fn, val_fn = args[0].data, args[1].data, args[2].data
             # Build: {index_key: {col_key: value, ...}, ...}
             pivot_data: dict = {}
-            all_cols: list = []
+            # Insertion-ordered dict: first-seen column order with O(1) membership
+            all_cols: dict = {}
             for item in items:
                 idx = self._call_function(idx_fn, [item], scope, line)
                 col = self._call_function(col_fn, [item], scope, line)
                 val = self._call_function(val_fn, [item], scope, line)
                 idx_key = format_value(idx)
                 col_key = format_value(col)
-                if idx_key not in pivot_data:
-                    pivot_data[idx_key] = {}
-                pivot_data[idx_key][col_key] = val
-                if col_key not in all_cols:
-                    all_cols.append(col_key)
+                pivot_data.setdefault(idx_key, {})[col_key] = val
+                all_cols[col_key] = None
             # Convert to list of maps: [{_index: key, col1: v1, col2: v2}, ...]
             result = []
             for idx_key, cols in pivot_data.items():
@@ -27,6 +27,10 @@ API_BOUNDS = ExecutionBounds(
     timeout_seconds=10.0,
 )
 
+# The kernel only holds configuration; each run() builds its own Runtime,
+# so a single instance serves every request.
+API_KERNEL = TinyTalkKernel(bounds=API_BOUNDS)
+
 
 @app.route("/")
 def ide():
@@ -46,8 +50,7 @@ def run_code():
     if not source:
         return jsonify({"success": False, "error": "No code provided"}), 400
 
-    kernel = TinyTalkKernel(bounds=API_BOUNDS)
-    result = kernel.run(source)
+    result = API_KERNEL.run(source)
 
     return jsonify({
         "success": result.success,
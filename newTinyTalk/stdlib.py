@@ -9,11 +9,9 @@ import hashlib
 import csv
 import json
 import io
-import urllib.request
-import urllib.error
 from datetime import datetime, timedelta
 
-from .types import Value, ValueType
+from .types import Value, ValueType, NUMERIC_TYPES, CONTAINER_TYPES
 
 
 # ---------------------------------------------------------------------------
@@ -24,7 +22,7 @@ def format_value(val: Value, seen: set = None) -> str:
     """Format a value for display, with circular-reference detection."""
     if seen is None:
         seen = set()
-    val_id = id(val.data) if val.type in (ValueType.LIST, ValueType.MAP) else None
+    val_id = id(val.data) if val.type in CONTAINER_TYPES else None
     if val_id is not None:
         if val_id in seen:
             return "[circular]" if val.type == ValueType.LIST else "{circular}"
@@ -411,7 +409,7 @@ def builtin_endswith(args: List[Value]) -> Value:
 def builtin_sum(args: List[Value]) -> Value:
     if not args or args[0].type != ValueType.LIST:
         return Value.int_val(0)
-    total = sum(v.data for v in args[0].data if v.type in (ValueType.INT, ValueType.FLOAT))
+    total = sum(v.data for v in args[0].data if v.type in NUMERIC_TYPES)
     return Value.float_val(total) if isinstance(total, float) else Value.int_val(total)
 
 
@@ -658,6 +656,10 @@ def _auto_type(s: str) -> Value:
 # File I/O: JSON
 # ---------------------------------------------------------------------------
 
+# json.dumps() builds a new JSONEncoder per call when given options; reuse them.
+_JSON_ENCODER = json.JSONEncoder(default=str)
+_JSON_FILE_ENCODER = json.JSONEncoder(indent=2, default=str)
+
 def builtin_read_json(args: List[Value]) -> Value:
     """read_json(path) -> value.  Parses a JSON file into TinyTalk values."""
     if not args or args[0].type != ValueType.STRING:
@@ -682,7 +684,8 @@ def builtin_write_json(args: List[Value]) -> Value:
         raise ValueError("write_json: second argument must be a path string")
     py_data = data.to_python()
     with open(path.data, "w", encoding="utf-8") as f:
-        json.dump(py_data, f, indent=2, default=str)
+        # One write; json.dump() would stream many small chunks into the file
+        f.write(_JSON_FILE_ENCODER.encode(py_data))
     return Value.null_val()
 
 
@@ -701,7 +704,7 @@ def builtin_to_json(args: List[Value]) -> Value:
     """to_json(value) -> string.  Serializes a TinyTalk value to a JSON string."""
     if not args:
         return Value.string_val("null")
-    return Value.string_val(json.dumps(args[0].to_python(), default=str))
+    return Value.string_val(_JSON_ENCODER.encode(args[0].to_python()))
 
 
 def _python_to_value(obj) -> Value:
@@ -731,6 +734,10 @@ def builtin_http_get(args: List[Value]) -> Value:
     """http_get(url) -> value.  GET a URL and parse the response as JSON."""
     if not args or args[0].type != ValueType.STRING:
         raise ValueError("http_get requires a URL string")
+    # Imported on first use; urllib.request dominates this module's import time
+    import urllib.request
+    import urllib.error
+
     url = args[0].data
     try:
         req = urllib.request.Request(url, headers={"Accept": "application/json", "User-Agent": "TinyTalk/2.0"})
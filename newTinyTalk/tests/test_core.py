@@ -7,13 +7,17 @@ import pytest
 from newTinyTalk import TinyTalkKernel, RunResult
 
 
-@pytest.fixture
+# The kernel holds no per-run state, so one instance serves the module.
+KERNEL = TinyTalkKernel()
+
+
+@pytest.fixture(scope="module")
 def kernel():
-    return TinyTalkKernel()
+    return KERNEL
 
 
 def run(code: str) -> RunResult:
-    return TinyTalkKernel().run(code)
+    return KERNEL.run(code)
 
 
 def output(code: str) -> str:
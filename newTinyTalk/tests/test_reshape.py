@@ -6,8 +6,11 @@ import pytest
 from newTinyTalk import TinyTalkKernel, RunResult
 
 
+KERNEL = TinyTalkKernel()
+
+
 def run(code: str) -> RunResult:
-    return TinyTalkKernel().run(code)
+    return KERNEL.run(code)
 
 
 def output(code: str) -> str:
@@ -268,6 +268,9 @@ class TestTeachingErrors:
     def test_find_closest_case_insensitive(self):
         assert find_closest("Filter", ["filter", "map", "sort"]) == "filter"
 
+    def test_find_closest_first_of_ties(self):
+        assert find_closest("mapp", ["sortBy", "map", "maps"]) == "map"
+
     # -- undefined variable suggestions --
 
     def test_undefined_variable_suggestion(self):
@@ -14,9 +14,12 @@ from newTinyTalk import TinyTalkKernel, transpile, transpile_pandas
 # Helpers
 # ---------------------------------------------------------------------------
 
+KERNEL = TinyTalkKernel()
+
+
 def run_tt(code: str) -> str:
     """Run TinyTalk code, return stdout."""
-    return TinyTalkKernel().run(code).output.strip()
+    return KERNEL.run(code).output.strip()
 
 
 def run_py(code: str) -> str:
@@ -160,7 +160,11 @@ class ValueType(Enum):
     ENUM_VARIANT = "enum_variant"
 
 
-@dataclass
+NUMERIC_TYPES = frozenset({ValueType.INT, ValueType.FLOAT})
+CONTAINER_TYPES = frozenset({ValueType.LIST, ValueType.MAP})
+
+
+@dataclass(slots=True)
 class Value:
     type: ValueType
     data: Any
@@ -181,11 +185,11 @@ class Value:
 
     @classmethod
     def bool_val(cls, b: bool) -> "Value":
-        return cls(ValueType.BOOLEAN, bool(b))
+        return TRUE if b else FALSE
 
     @classmethod
     def null_val(cls) -> "Value":
-        return cls(ValueType.NULL, None)
+        return NULL
 
     @classmethod
     def list_val(cls, items: list) -> "Value":
@@ -241,3 +245,9 @@ class Value:
         if self.type == ValueType.FUNCTION:
             return "<function>"
         return str(self.data)
+
+
+# Values are never mutated in place, so null and the booleans are shared.
+NULL = Value(ValueType.NULL, None)
+TRUE = Value(ValueType.BOOLEAN, True)
+FALSE = Value(ValueType.BOOLEAN, False)
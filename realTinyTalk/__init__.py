@@ -90,7 +90,7 @@ def run(source: str, bounds: ExecutionBounds = None) -> Value:
     tokens = lexer.tokenize()
     parser = Parser(tokens)
     ast = parser.parse()
-    runtime = Runtime(bounds)
+    runtime = Runtime(bounds, trace=False)
     return runtime.execute(ast)
 
 
@@ -42,6 +42,38 @@ from realTinyTalk.parser import (
     ReturnStmt, BreakStmt, ContinueStmt, FnDecl, StructDecl, ImportStmt
 )
 
+# Operators whose JS spelling differs from realTinyTalk's
+JS_OPS = {
+    'and': '&&',
+    'or': '||',
+    '==': '===',
+    '!=': '!==',
+}
+
+# Builtin calls routed through the tt runtime
+RUNTIME_FUNCS = frozenset({
+    'show', 'print', 'println',
+    'len', 'typeof', 'str', 'int', 'float', 'bool',
+    'range', 'abs', 'floor', 'ceil', 'round',
+    'min', 'max', 'sum', 'avg',
+    'push', 'pop', 'append', 'concat', 'slice', 'join', 'split',
+    'keys', 'values', 'upcase', 'lowcase', 'trim', 'chars', 'words',
+})
+
+# Magic properties resolved by the tt.prop helper
+MAGIC_PROPS = frozenset({
+    'len', 'length', 'first', 'last', 'rest',
+    'upcase', 'lowcase', 'trim', 'chars', 'words',
+    'sum', 'avg', 'min', 'max', 'sorted', 'sort', 'reversed', 'uniq',
+    'keys', 'vals', 'values', 'empty', 'any',
+    'str', 'int', 'float', 'bool', 'type'
+})
+
+# Steps that return a value rather than the chain
+TERMINAL_STEPS = frozenset({
+    'first', 'last', 'sum', 'avg', 'min', 'max', 'count', 'find', 'any', 'all', 'none',
+})
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # JS EMITTER
@@ -57,6 +89,37 @@ class JSEmitter:
         self.indent_size = indent_size
         self.indent_level = 0
         self.output_lines: List[str] = []
+        
+        # NodeType -> bound emitter, built once instead of per node
+        self._handlers = {
+            NodeType.LITERAL: self._emit_literal,
+            NodeType.IDENTIFIER: self._emit_identifier,
+            NodeType.BINARY_OP: self._emit_binary,
+            NodeType.UNARY_OP: self._emit_unary,
+            NodeType.CALL: self._emit_call,
+            NodeType.INDEX: self._emit_index,
+            NodeType.MEMBER: self._emit_member,
+            NodeType.ARRAY: self._emit_array,
+            NodeType.MAP_LITERAL: self._emit_map,
+            NodeType.LAMBDA: self._emit_lambda,
+            NodeType.CONDITIONAL: self._emit_conditional,
+            NodeType.RANGE: self._emit_range,
+            NodeType.PIPE: self._emit_pipe,
+            NodeType.STEP_CHAIN: self._emit_step_chain,
+            NodeType.LET_STMT: self._emit_let,
+            NodeType.CONST_STMT: self._emit_const,
+            NodeType.ASSIGN: self._emit_assign,
+            NodeType.BLOCK_STMT: self._emit_block,
+            NodeType.IF_STMT: self._emit_if,
+            NodeType.FOR_STMT: self._emit_for,
+            NodeType.WHILE_STMT: self._emit_while,
+            NodeType.RETURN_STMT: self._emit_return,
+            NodeType.BREAK_STMT: self._emit_break,
+            NodeType.CONTINUE_STMT: self._emit_continue,
+            NodeType.FN_DECL: self._emit_function,
+            NodeType.STRUCT_DECL: self._emit_class,
+            NodeType.IMPORT_STMT: self._emit_import,
+        }
     
     def emit(self, ast: Program) -> str:
         """Emit JavaScript from AST."""
@@ -97,8 +160,21 @@ class JSEmitter:
     # RUNTIME HEADER
     # ─────────────────────────────────────────────────────────────────────────
     
+    # Runtime header lines, captured on first emit and shared by all emitters
+    _runtime_header: Optional[tuple] = None
+    
     def _emit_runtime_header(self):
         """Emit the tinyTalk runtime shim."""
+        cls = type(self)
+        if cls._runtime_header is None:
+            start = len(self.output_lines)
+            self._write_runtime_header()
+            cls._runtime_header = tuple(self.output_lines[start:])
+        else:
+            self.output_lines.extend(cls._runtime_header)
+    
+    def _write_runtime_header(self):
+        """Write the header line by line; only runs on the first emit."""
         self._write_raw("// ═══════════════════════════════════════════════════════════════")
         self._write_raw("// Generated by realTinyTalk → JavaScript transpiler")
         self._write_raw("// ═══════════════════════════════════════════════════════════════")
@@ -304,37 +380,7 @@ class JSEmitter:
         if node is None:
             return ''
         
-        handlers = {
-            NodeType.LITERAL: self._emit_literal,
-            NodeType.IDENTIFIER: self._emit_identifier,
-            NodeType.BINARY_OP: self._emit_binary,
-            NodeType.UNARY_OP: self._emit_unary,
-            NodeType.CALL: self._emit_call,
-            NodeType.INDEX: self._emit_index,
-            NodeType.MEMBER: self._emit_member,
-            NodeType.ARRAY: self._emit_array,
-            NodeType.MAP_LITERAL: self._emit_map,
-            NodeType.LAMBDA: self._emit_lambda,
-            NodeType.CONDITIONAL: self._emit_conditional,
-            NodeType.RANGE: self._emit_range,
-            NodeType.PIPE: self._emit_pipe,
-            NodeType.STEP_CHAIN: self._emit_step_chain,
-            NodeType.LET_STMT: self._emit_let,
-            NodeType.CONST_STMT: self._emit_const,
-            NodeType.ASSIGN: self._emit_assign,
-            NodeType.BLOCK_STMT: self._emit_block,
-            NodeType.IF_STMT: self._emit_if,
-            NodeType.FOR_STMT: self._emit_for,
-            NodeType.WHILE_STMT: self._emit_while,
-            NodeType.RETURN_STMT: self._emit_return,
-            NodeType.BREAK_STMT: self._emit_break,
-            NodeType.CONTINUE_STMT: self._emit_continue,
-            NodeType.FN_DECL: self._emit_function,
-            NodeType.STRUCT_DECL: self._emit_class,
-            NodeType.IMPORT_STMT: self._emit_import,
-        }
-        
-        handler = handlers.get(node.type)
+        handler = self._handlers.get(node.type)
         if handler:
             return handler(node)
         
@@ -393,13 +439,7 @@ class JSEmitter:
             return f'Math.pow({left}, {right})'
         
         # Standard ops
-        js_ops = {
-            'and': '&&',
-            'or': '||',
-            '==': '===',
-            '!=': '!==',
-        }
-        js_op = js_ops.get(op, op)
+        js_op = JS_OPS.get(op, op)
         
         return f'({left} {js_op} {right})'
     
@@ -424,16 +464,7 @@ class JSEmitter:
             name = node.callee.name
             
             # Map to runtime
-            runtime_funcs = {
-                'show', 'print', 'println',
-                'len', 'typeof', 'str', 'int', 'float', 'bool',
-                'range', 'abs', 'floor', 'ceil', 'round',
-                'min', 'max', 'sum', 'avg',
-                'push', 'pop', 'append', 'concat', 'slice', 'join', 'split',
-                'keys', 'values', 'upcase', 'lowcase', 'trim', 'chars', 'words',
-            }
-            
-            if name in runtime_funcs:
+            if name in RUNTIME_FUNCS:
                 return f'tt.{name}({args})'
         
         callee = self._emit_node(node.callee)
@@ -451,15 +482,7 @@ class JSEmitter:
         field = node.field
         
         # Property magic - use runtime helper
-        magic_props = {
-            'len', 'length', 'first', 'last', 'rest',
-            'upcase', 'lowcase', 'trim', 'chars', 'words',
-            'sum', 'avg', 'min', 'max', 'sorted', 'sort', 'reversed', 'uniq',
-            'keys', 'vals', 'values', 'empty', 'any',
-            'str', 'int', 'float', 'bool', 'type'
-        }
-        
-        if field in magic_props:
+        if field in MAGIC_PROPS:
             return f'tt.prop({obj}, "{field}")'
         
         return f'{obj}.{field}'
@@ -516,7 +539,7 @@ class JSEmitter:
         """Emit step chain (dplyr-style)."""
         source = self._emit_node(node.source)
         
-        chain = f'tt.chain({source})'
+        parts = [f'tt.chain({source})']
         
         for step_name, args in node.steps:
             # Remove underscore prefix for JS
@@ -524,22 +547,16 @@ class JSEmitter:
             
             if args:
                 arg_str = ', '.join(self._emit_node(a) for a in args)
-                chain += f'.{method}({arg_str})'
+                parts.append(f'.{method}({arg_str})')
             else:
-                # Terminal steps (return value) vs chain steps (return chain)
-                terminal_steps = {'first', 'last', 'sum', 'avg', 'min', 'max', 'count', 'find', 'any', 'all', 'none'}
-                if method in terminal_steps:
-                    chain += f'.{method}()'
-                else:
-                    chain += f'.{method}()'
+                parts.append(f'.{method}()')
         
         # Add .value() if chain ends with a non-terminal step
         last_step = node.steps[-1][0].lstrip('_') if node.steps else ''
-        terminal_steps = {'first', 'last', 'sum', 'avg', 'min', 'max', 'count', 'find', 'any', 'all', 'none'}
-        if last_step not in terminal_steps:
-            chain += '.value()'
+        if last_step not in TERMINAL_STEPS:
+            parts.append('.value()')
         
-        return chain
+        return ''.join(parts)
     
     # ─────────────────────────────────────────────────────────────────────────
     # STATEMENTS
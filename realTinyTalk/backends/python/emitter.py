@@ -37,9 +37,72 @@ from realTinyTalk.parser import (
     Literal, BinaryOp, UnaryOp, Call, Index, Array, MapLiteral,
     Lambda, Conditional, Range, Pipe, StepChain,
     LetStmt, ConstStmt, AssignStmt, Block, IfStmt, ForStmt, WhileStmt,
-    ReturnStmt, FnDecl, StructDecl, ImportStmt, Identifier,
+    ReturnStmt, BreakStmt, ContinueStmt, FnDecl, StructDecl, ImportStmt, Identifier,
 )
 
+# Operator mapping
+OP_MAP = {
+    'and': 'and',
+    'or': 'or',
+    'is': '==',
+    'isnt': '!=',
+    '==': '==',
+    '!=': '!=',
+    '<': '<',
+    '>': '>',
+    '<=': '<=',
+    '>=': '>=',
+    '+': '+',
+    '-': '-',
+    '*': '*',
+    '/': '/',
+    '%': '%',
+    '**': '**',
+    '^': '**',
+    '..': '',  # range handled separately
+}
+
+# Built-in function mapping
+BUILTIN_CALLS = {
+    'show': 'tt.show',
+    'print': 'tt.show',
+    'len': 'len',
+    'str': 'str',
+    'int': 'int',
+    'float': 'float',
+    'bool': 'bool',
+    'list': 'list',
+    'type': 'type',
+    'range': 'range',
+    'abs': 'abs',
+    'min': 'min',
+    'max': 'max',
+    'sum': 'sum',
+    'sorted': 'sorted',
+    'reversed': 'reversed',
+    'enumerate': 'enumerate',
+    'zip': 'zip',
+    'map': 'map',
+    'filter': 'filter',
+    'input': 'input',
+    'sqrt': 'math.sqrt',
+    'floor': 'math.floor',
+    'ceil': 'math.ceil',
+    'round': 'round',
+    'random': 'random.random',
+}
+
+# Member chains that map onto builtins
+MEMBER_BUILTINS = {
+    'upcase': 'upcase',
+    'len': 'len',
+    'reversed': 'reversed',
+    'str': 'str',
+}
+
+# Steps that return a value rather than the chain
+TERMINAL_OPS = frozenset({'sum', 'avg', 'first', 'last', 'find', 'any', 'all', 'none', 'count', 'join'})
+
 
 class PythonEmitter:
     """
@@ -51,6 +114,42 @@ class PythonEmitter:
         self.indent_size = indent_size
         self.indent_level = 0
         self.output_lines: List[str] = []
+        
+        # NodeType -> bound emitter, built once instead of an if-chain per node
+        self._handlers = {
+            NodeType.LITERAL: self._emit_literal,
+            NodeType.IDENTIFIER: self._emit_identifier,
+            NodeType.BINARY_OP: self._emit_binary,
+            NodeType.UNARY_OP: self._emit_unary,
+            NodeType.CALL: self._emit_call,
+            NodeType.INDEX: self._emit_index,
+            NodeType.MEMBER: self._emit_member,
+            NodeType.ARRAY: self._emit_array,
+            NodeType.MAP_LITERAL: self._emit_map,
+            NodeType.LAMBDA: self._emit_lambda,
+            NodeType.CONDITIONAL: self._emit_conditional_expr,
+            NodeType.RANGE: self._emit_range,
+            NodeType.PIPE: self._emit_pipe,
+            NodeType.STEP_CHAIN: self._emit_step_chain,
+            NodeType.LET_STMT: self._emit_let,
+            NodeType.CONST_STMT: self._emit_const,
+            NodeType.ASSIGN: self._emit_assign,
+            NodeType.BLOCK_STMT: self._emit_block,
+            NodeType.IF_STMT: self._emit_if,
+            NodeType.FOR_STMT: self._emit_for,
+            NodeType.WHILE_STMT: self._emit_while,
+            NodeType.RETURN_STMT: self._emit_return,
+            NodeType.BREAK_STMT: self._emit_break,
+            NodeType.CONTINUE_STMT: self._emit_continue,
+            NodeType.FN_DECL: self._emit_function,
+            NodeType.STRUCT_DECL: self._emit_struct,
+            NodeType.BLUEPRINT: self._emit_struct,
+            NodeType.IMPORT_STMT: self._emit_import,
+            NodeType.EXPR_STMT: self._emit_expr_stmt,
+            NodeType.LAW: self._emit_function,
+            NodeType.FORGE: self._emit_function,
+            NodeType.REPLY_STMT: self._emit_return,
+        }
     
     def emit(self, ast: Program) -> str:
         """Emit Python from AST."""
@@ -79,8 +178,21 @@ class PythonEmitter:
     def _write_raw(self, line: str):
         self.output_lines.append(line)
     
+    # Runtime header lines, captured on first emit and shared by all emitters
+    _runtime_header: Optional[tuple] = None
+    
     def _emit_runtime_header(self):
         """Emit the Python runtime helper."""
+        cls = type(self)
+        if cls._runtime_header is None:
+            start = len(self.output_lines)
+            self._write_runtime_header()
+            cls._runtime_header = tuple(self.output_lines[start:])
+        else:
+            self.output_lines.extend(cls._runtime_header)
+    
+    def _write_runtime_header(self):
+        """Write the header line by line; only runs on the first emit."""
         self._write_raw('"""')
         self._write_raw('Generated from realTinyTalk')
         self._write_raw('"""')
@@ -221,115 +333,23 @@ class PythonEmitter:
         if node is None:
             return ''
         
-        ntype = node.type
-        
-        # Literals
-        if ntype == NodeType.LITERAL:
-            return self._emit_literal(node)
-        
-        # Identifiers
-        if ntype == NodeType.IDENTIFIER:
-            return node.name
-        
-        # Binary operations
-        if ntype == NodeType.BINARY_OP:
-            return self._emit_binary(node)
-        
-        # Unary operations
-        if ntype == NodeType.UNARY_OP:
-            return self._emit_unary(node)
-        
-        # Function calls
-        if ntype == NodeType.CALL:
-            return self._emit_call(node)
-        
-        # Index access
-        if ntype == NodeType.INDEX:
-            return self._emit_index(node)
-        
-        # Member access
-        if ntype == NodeType.MEMBER:
-            return self._emit_member(node)
-        
-        # Array literal
-        if ntype == NodeType.ARRAY:
-            return self._emit_array(node)
-        
-        # Map/Object literal
-        if ntype == NodeType.MAP_LITERAL:
-            return self._emit_map(node)
-        
-        # Lambda
-        if ntype == NodeType.LAMBDA:
-            return self._emit_lambda(node)
-        
-        # Conditional expression
-        if ntype == NodeType.CONDITIONAL:
-            return self._emit_conditional_expr(node)
-        
-        # Range
-        if ntype == NodeType.RANGE:
-            return self._emit_range(node)
-        
-        # Pipe
-        if ntype == NodeType.PIPE:
-            return self._emit_pipe(node)
-        
-        # Step chain
-        if ntype == NodeType.STEP_CHAIN:
-            return self._emit_step_chain(node)
-        
-        # Statements
-        if ntype == NodeType.LET_STMT:
-            return self._emit_let(node)
-        
-        if ntype == NodeType.CONST_STMT:
-            return self._emit_const(node)
+        handler = self._handlers.get(node.type)
+        if handler:
+            return handler(node)
         
-        if ntype == NodeType.ASSIGN:
-            return self._emit_assign(node)
-        
-        if ntype == NodeType.BLOCK_STMT:
-            return self._emit_block(node)
-        
-        if ntype == NodeType.IF_STMT:
-            return self._emit_if(node)
-        
-        if ntype == NodeType.FOR_STMT:
-            return self._emit_for(node)
-        
-        if ntype == NodeType.WHILE_STMT:
-            return self._emit_while(node)
-        
-        if ntype == NodeType.RETURN_STMT:
-            return self._emit_return(node)
-        
-        if ntype == NodeType.BREAK_STMT:
-            return 'break'
-        
-        if ntype == NodeType.CONTINUE_STMT:
-            return 'continue'
-        
-        if ntype == NodeType.FN_DECL:
-            return self._emit_function(node)
-        
-        if ntype == NodeType.STRUCT_DECL or ntype == NodeType.BLUEPRINT:
-            return self._emit_struct(node)
-        
-        if ntype == NodeType.IMPORT_STMT:
-            return self._emit_import(node)
-        
-        # TinyTalk specific
-        if ntype == NodeType.EXPR_STMT:
-            return self._emit_node(node.expression) if hasattr(node, 'expression') else ''
-        
-        if ntype == NodeType.LAW or ntype == NodeType.FORGE:
-            return self._emit_function(node)
-        
-        if ntype == NodeType.REPLY_STMT:
-            return self._emit_return(node)
-        
-        return f'# Unknown node: {ntype}'
+        return f'# Unknown node: {node.type}'
+    
+    def _emit_identifier(self, node: Identifier) -> str:
+        return node.name
+    
+    def _emit_break(self, node: BreakStmt) -> str:
+        return 'break'
+    
+    def _emit_continue(self, node: ContinueStmt) -> str:
+        return 'continue'
+    
+    def _emit_expr_stmt(self, node: ASTNode) -> str:
+        return self._emit_node(node.expression) if hasattr(node, 'expression') else ''
     
     def _emit_literal(self, node: Literal) -> str:
         val = node.value
@@ -347,28 +367,6 @@ class PythonEmitter:
         right = self._emit_node(node.right)
         op = node.op
         
-        # Operator mapping
-        op_map = {
-            'and': 'and',
-            'or': 'or',
-            'is': '==',
-            'isnt': '!=',
-            '==': '==',
-            '!=': '!=',
-            '<': '<',
-            '>': '>',
-            '<=': '<=',
-            '>=': '>=',
-            '+': '+',
-            '-': '-',
-            '*': '*',
-            '/': '/',
-            '%': '%',
-            '**': '**',
-            '^': '**',
-            '..': '',  # range handled separately
-        }
-        
         # Special cases
         if op == 'is':
             return f'tt.is_({left}, {right})'
@@ -382,7 +380,7 @@ class PythonEmitter:
             # Convert glob pattern to regex
             return f'tt.islike({left}, {right})'
         
-        py_op = op_map.get(op, op)
+        py_op = OP_MAP.get(op, op)
         return f'({left} {py_op} {right})'
     
     def _emit_unary(self, node: UnaryOp) -> str:
@@ -400,37 +398,7 @@ class PythonEmitter:
         callee = self._emit_node(node.callee)
         args = ', '.join(self._emit_node(a) for a in node.args)
         
-        # Built-in function mapping
-        builtins = {
-            'show': 'tt.show',
-            'print': 'tt.show',
-            'len': 'len',
-            'str': 'str',
-            'int': 'int',
-            'float': 'float',
-            'bool': 'bool',
-            'list': 'list',
-            'type': 'type',
-            'range': 'range',
-            'abs': 'abs',
-            'min': 'min',
-            'max': 'max',
-            'sum': 'sum',
-            'sorted': 'sorted',
-            'reversed': 'reversed',
-            'enumerate': 'enumerate',
-            'zip': 'zip',
-            'map': 'map',
-            'filter': 'filter',
-            'input': 'input',
-            'sqrt': 'math.sqrt',
-            'floor': 'math.floor',
-            'ceil': 'math.ceil',
-            'round': 'round',
-            'random': 'random.random',
-        }
-        
-        py_callee = builtins.get(callee, callee)
+        py_callee = BUILTIN_CALLS.get(callee, callee)
         return f'{py_callee}({args})'
     
     def _emit_index(self, node: Index) -> str:
@@ -455,16 +423,10 @@ class PythonEmitter:
             return f'tt.prop({base}, "{field}")'
 
         # For chained properties (e.g., a.upcase.len) emit nested builtins when possible
-        builtin_map = {
-            'upcase': 'upcase',
-            'len': 'len',
-            'reversed': 'reversed',
-            'str': 'str',
-        }
         result = base
         for field in reversed(fields):
-            if field in builtin_map:
-                fn = builtin_map[field]
+            if field in MEMBER_BUILTINS:
+                fn = MEMBER_BUILTINS[field]
                 result = f'{fn}({result})'
             else:
                 result = f'tt.prop({result}, "{field}")'
@@ -515,7 +477,6 @@ class PythonEmitter:
     def _emit_step_chain(self, node: StepChain) -> str:
         obj = self._emit_node(node.source)
         steps = node.steps
-        terminal_ops = ['sum', 'avg', 'first', 'last', 'find', 'any', 'all', 'none', 'count', 'join']
         # If dotted chain (written with dots), emit nested function-style calls: sum(take(reverse(sort(obj)), 2))
         if getattr(node, 'dotted', False):
             nested = obj
@@ -528,15 +489,15 @@ class PythonEmitter:
                     nested = f'{py_method}({nested})'
             return nested
         # Otherwise (space-separated chain tokens), emit chain method for readability (.sort(), .take(n), etc.)
-        result = f'tt.chain({obj})'
+        parts = [f'tt.chain({obj})']
         for step_name, step_args in steps:
             py_method = step_name.lstrip('_')
             args = ', '.join(self._emit_node(a) for a in step_args) if step_args else ''
-            result += f'.{py_method}({args})'
+            parts.append(f'.{py_method}({args})')
         last_step = steps[-1][0].lstrip('_') if steps else ''
-        if last_step not in terminal_ops:
-            result += '.value()'
-        return result
+        if last_step not in TERMINAL_OPS:
+            parts.append('.value()')
+        return ''.join(parts)
     
     def _emit_let(self, node: LetStmt) -> str:
         name = node.name
@@ -9,7 +9,9 @@ Compile → Bound → Execute → Verify → Ledger → Return
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Callable, Union
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Callable, Union
 import time
 import hashlib
 import json
@@ -19,6 +21,11 @@ import json
 # HELPERS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# json.dumps() builds a new JSONEncoder per call when given options; reuse one.
+_STABLE_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_STABLE_SORTED_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
 def stable_json(x: Any) -> str:
     """Deterministic JSON serialization."""
     def norm(v):
@@ -29,19 +36,25 @@ def stable_json(x: Any) -> str:
         if isinstance(v, dict):
             return {k: norm(v[k]) for k in sorted(v.keys())}
         return repr(v)
-    return json.dumps(norm(x), ensure_ascii=False, separators=(",", ":"))
+    return _STABLE_ENCODER.encode(norm(x))
+
+
+# Pristine context; copy() is cheaper than constructing a new hash object.
+_SHA256_BASE = hashlib.sha256()
 
 
 def sha256(s: str) -> str:
     """SHA-256 hash of string."""
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+    h = _SHA256_BASE.copy()
+    h.update(s.encode("utf-8"))
+    return h.hexdigest()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TRACE - Audit trail for every operation
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class Trace:
     """A single trace entry in the execution log."""
     step: str
@@ -68,7 +81,7 @@ class Trace:
 # FIN / FINFR - Success and failure types
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class Fin:
     """Successful computation result."""
     kind: str = "fin"
@@ -86,7 +99,7 @@ class Fin:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Finfr:
     """Failed computation result (fin-failure-reason)."""
     kind: str = "finfr"
@@ -121,7 +134,7 @@ def finfr(reason: str, trace: List[Trace]) -> Finfr:
 # EXECUTION BOUNDS - The difference between Turing and verified
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionBounds:
     """
     Every computation has bounds.
@@ -148,7 +161,7 @@ class ExecutionBounds:
 # LEDGER - Hash-chained audit trail
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LedgerEntry:
     """Immutable ledger entry with hash chain."""
     index: int
@@ -161,23 +174,33 @@ class LedgerEntry:
 
 
 class Ledger:
-    """Hash-chained audit ledger."""
+    """
+    Hash-chained audit ledger.
 
-    def __init__(self) -> None:
-        self.entries: List[LedgerEntry] = []
+    Keeps the most recent `max_entries` entries (None = unbounded) so a
+    long-lived kernel does not grow without limit; indices keep counting.
+    Evicted entries are not persisted anywhere and cannot be recovered.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 10_000) -> None:
+        self.entries: Deque[LedgerEntry] = deque(maxlen=max_entries)
+        self._next_index = 0
+        self._verified: Optional[tuple[int, str]] = None  # (index, hash) of last verified entry
 
     def append(self, op: str, input_obj: Any, output_obj: Any) -> LedgerEntry:
         """Add entry to ledger with hash chain."""
         prev_hash = self.entries[-1].hash if self.entries else "GENESIS"
         body = {
-            "i": len(self.entries),
+            "i": self._next_index,
             "ts": time.time(),
             "op": op,
             "in_hash": sha256(stable_json(input_obj)),
             "out_hash": sha256(stable_json(output_obj)),
             "prev_hash": prev_hash,
         }
-        h = sha256(stable_json(body))
+        # body holds only primitives, so a sort_keys encode is exactly
+        # stable_json(body) without the normalizing copy.
+        h = sha256(_STABLE_SORTED_ENCODER.encode(body))
         entry = LedgerEntry(
             index=body["i"],
             timestamp=body["ts"],
@@ -188,14 +211,45 @@ class Ledger:
             hash=h
         )
         self.entries.append(entry)
+        self._next_index += 1
         return entry
 
-    def verify_chain(self) -> bool:
-        """Verify the hash chain integrity."""
-        for i, entry in enumerate(self.entries):
-            expected_prev = self.entries[i-1].hash if i > 0 else "GENESIS"
-            if entry.prev_hash != expected_prev:
+    def verify_chain(self, incremental: bool = False) -> bool:
+        """
+        Verify the hash chain integrity of the retained entries.
+
+        Every retained link is checked by default. With incremental=True only
+        entries appended since the last successful check are walked, newest
+        first, as long as the last verified entry is still present with the
+        same hash (otherwise everything is re-walked). Links at or before that
+        entry are trusted, so tampering with older entries goes unnoticed.
+        """
+        entries = self.entries
+        if not entries:
+            return True
+
+        anchor = None
+        count = len(entries)
+        if self._verified is not None and incremental:
+            index, digest = self._verified
+            pos = index - entries[0].index
+            if 0 <= pos < count:
+                anchor, count = digest, count - pos
+
+        # Walk the tail back to the anchor (or the oldest retained entry)
+        walk = islice(reversed(entries), count)
+        cur = next(walk)
+        for prev in walk:
+            if cur.prev_hash != prev.hash:
                 return False
+            cur = prev
+
+        if anchor is not None and cur.hash != anchor:
+            return self.verify_chain()
+        # Oldest retained entry; its predecessor may have been evicted
+        if count == len(entries) and cur.index == 0 and cur.prev_hash != "GENESIS":
+            return False
+        self._verified = (entries[-1].index, entries[-1].hash)
         return True
 
     def __len__(self) -> int:
@@ -206,7 +260,7 @@ class Ledger:
 # TRUST POLICY
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrustPolicy:
     """Trust configuration for external resources."""
     allow_ffi: bool = True             # Allow foreign function interface
@@ -229,28 +283,32 @@ class Compiler:
         self.lexer_class = Lexer
         self.parser_class = Parser
 
-    def compile(self, source: str) -> Result:
-        """Compile source code to AST."""
-        trace = [Trace.t("compile:start", True, {"length": len(source)})]
+    def compile(self, source: str, traced: bool = True) -> Result:
+        """Compile source code to AST (traced=False leaves the trace empty)."""
+        trace = [Trace.t("compile:start", True, {"length": len(source)})] if traced else []
 
         try:
             # Tokenize
             lexer = self.lexer_class(source)
             tokens = lexer.tokenize()
-            trace.append(Trace.t("compile:tokenize", True, {"tokens": len(tokens)}))
+            if traced:
+                trace.append(Trace.t("compile:tokenize", True, {"tokens": len(tokens)}))
 
             # Parse
             parser = self.parser_class(tokens)
             ast = parser.parse()
-            trace.append(Trace.t("compile:parse", True, {"nodes": len(ast) if isinstance(ast, list) else 1}))
+            if traced:
+                trace.append(Trace.t("compile:parse", True, {"nodes": len(ast) if isinstance(ast, list) else 1}))
 
             return fin(ast, trace)
 
         except SyntaxError as e:
-            trace.append(Trace.t("compile:error", False, note=str(e)))
+            if traced:
+                trace.append(Trace.t("compile:error", False, note=str(e)))
             return finfr(f"Syntax error: {e}", trace)
         except Exception as e:
-            trace.append(Trace.t("compile:error", False, note=str(e)))
+            if traced:
+                trace.append(Trace.t("compile:error", False, note=str(e)))
             return finfr(f"Compilation error: {e}", trace)
 
 
@@ -286,7 +344,7 @@ class Verifier:
         trace = [Trace.t("verify:postcheck", True)]
 
         # Check for unverified values
-        if hasattr(result, 'verified') and not result.verified:
+        if not getattr(result, 'verified', True):
             trace.append(Trace.t("verify:unverified", False))
             return finfr("Result contains unverified values", trace)
 
@@ -312,26 +370,27 @@ class Executor:
     def __init__(self, bounds: ExecutionBounds):
         self.bounds = bounds
 
-    def run(self, ast: Any, env: Dict[str, Any]) -> tuple[Any, List[Trace]]:
-        """Execute AST within bounds."""
+    def run(self, ast: Any, env: Dict[str, Any], traced: bool = True) -> tuple[Any, List[Trace]]:
+        """Execute AST within bounds (traced=False leaves the trace empty)."""
         from .runtime import Runtime
         
-        trace = [Trace.t("exec:start", True)]
+        trace = [Trace.t("exec:start", True)] if traced else []
         start_time = time.time()
 
         try:
-            runtime = Runtime(self.bounds)
+            runtime = Runtime(self.bounds, trace=False)
             # Seed global scope with env bindings
             if env:
                 for k, v in env.items():
                     runtime.global_scope.set(k, v)
             result = runtime.execute(ast)
             
-            elapsed = time.time() - start_time
-            trace.append(Trace.t("exec:done", True, {
-                "ops": runtime.op_count,
-                "elapsed_ms": int(elapsed * 1000)
-            }))
+            if traced:
+                elapsed = time.time() - start_time
+                trace.append(Trace.t("exec:done", True, {
+                    "ops": runtime.op_count,
+                    "elapsed_ms": int(elapsed * 1000)
+                }))
             
             return result, trace
 
@@ -390,41 +449,62 @@ class TinyTalkKernel:
 
     def run(self, source: str) -> Result:
         """Execute TinyTalk source code."""
-        trace: List[Trace] = [Trace.t("kernel:start", True)]
+        return self._execute(source, traced=True)
+
+    def eval(self, source: str) -> Any:
+        """
+        Convenience method - execute and return just the value.
+
+        Runs the same pipeline as run() untraced: no trace is built and the
+        ledger chain is not re-verified, since the caller sees neither.
+        """
+        result = self._execute(source, traced=False)
+        if isinstance(result, Fin):
+            return result.value
+        raise RuntimeError(result.reason)
+
+    def _execute(self, source: str, traced: bool) -> Result:
+        """Compile, verify, execute, verify, commit to the ledger (and meta-verify when traced)."""
+        trace: List[Trace] = [Trace.t("kernel:start", True)] if traced else []
+        stamp = {"source": source[:100]}
 
         # 1) Compile
-        compile_result = self.compiler.compile(source)
+        compile_result = self.compiler.compile(source, traced)
         trace.extend(compile_result.trace)
         if isinstance(compile_result, Finfr):
-            self.ledger.append("finfr", {"source": source[:100]}, {"reason": compile_result.reason})
+            self.ledger.append("finfr", stamp, {"reason": compile_result.reason})
             return finfr(compile_result.reason, trace)
 
         ast = compile_result.value
 
         # 2) Pre-verify
         pre = self.verifier.precheck(ast)
-        trace.extend(pre.trace)
+        if traced:
+            trace.extend(pre.trace)
         if isinstance(pre, Finfr):
-            self.ledger.append("finfr", {"source": source[:100]}, {"reason": pre.reason})
+            self.ledger.append("finfr", stamp, {"reason": pre.reason})
             return finfr(pre.reason, trace)
 
         # 3) Execute (bounded)
         try:
-            result, exec_trace = self.executor.run(ast, self.env)
+            result, exec_trace = self.executor.run(ast, self.env, traced)
             trace.extend(exec_trace)
         except RuntimeError as e:
-            self.ledger.append("finfr", {"source": source[:100]}, {"reason": str(e)})
+            self.ledger.append("finfr", stamp, {"reason": str(e)})
             return finfr(str(e), trace)
 
         # 4) Post-verify
         post = self.verifier.postcheck(result, trace)
-        trace.extend(post.trace)
+        if traced:
+            trace.extend(post.trace)
         if isinstance(post, Finfr):
-            self.ledger.append("unverified", {"source": source[:100]}, {"result": str(result)})
+            self.ledger.append("unverified", stamp, {"result": str(result)})
             return finfr(post.reason, trace)
 
         # 5) Ledger commit
-        entry = self.ledger.append("fin", {"source": source[:100]}, {"result": str(result)})
+        entry = self.ledger.append("fin", stamp, {"result": str(result)})
+        if not traced:
+            return fin(result, trace)
         trace.append(Trace.t("ledger:commit", True, {"hash": entry.hash}))
 
         # 6) Meta verify
@@ -433,13 +513,6 @@ class TinyTalkKernel:
 
         return fin(result, trace)
 
-    def eval(self, source: str) -> Any:
-        """Convenience method - execute and return just the value."""
-        result = self.run(source)
-        if isinstance(result, Fin):
-            return result.value
-        raise RuntimeError(result.reason)
-
     def repl(self):
         """Interactive REPL."""
         print("TinyTalk v1.0 - Verified Computation")
@@ -487,6 +560,7 @@ Language:
 
     def _print_ledger(self):
         print(f"\nLedger ({len(self.ledger)} entries):")
-        for entry in self.ledger.entries[-10:]:
+        entries = self.ledger.entries
+        for entry in islice(entries, max(len(entries) - 10, 0), None):
             print(f"  [{entry.index}] {entry.operation}: {entry.hash[:16]}...")
         print()
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from typing import List, Optional, Any
 import re
+import sys
 
 
 class TokenType(Enum):
@@ -200,7 +201,7 @@ class TokenType(Enum):
     COMMENT = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """A token in the source code."""
     type: TokenType
@@ -214,6 +215,26 @@ class Token:
         return f"Token({self.type.name}, {self.value!r})"
 
 
+# Identifier tail: same set as str.isalnum() plus '_'.
+_WORD_RE = re.compile(r'\w*')
+
+# Characters that end a run of plain string content, keyed by
+# (quote, raw, triple): the quote, '\\' unless raw, '\n' unless triple.
+_STRING_STOP_RE = {
+    (q, raw, triple): re.compile(
+        '[' + re.escape(q + ('' if raw else '\\') + ('' if triple else '\n')) + ']')
+    for q in '"\'' for raw in (False, True) for triple in (False, True)
+}
+
+
+def _bucket_by_first(ops):
+    """Group (op, token_type) pairs by first char, keeping longest-first order."""
+    buckets = {}
+    for op, token_type in ops:
+        buckets.setdefault(op[0], []).append((op, token_type))
+    return {c: tuple(group) for c, group in buckets.items()}
+
+
 class Lexer:
     """
     TinyTalk Lexer - Tokenizes source code.
@@ -346,6 +367,10 @@ class Lexer:
         ('..=', TokenType.RANGE_INCL),
         ('..', TokenType.RANGE),
     ]
+
+    # Same operators keyed by first character: _scan_token only tries the
+    # few that can match at the current position.
+    OPERATORS_BY_FIRST = _bucket_by_first(OPERATORS)
     
     # Single-character operators
     SINGLE_OPS = {
@@ -377,6 +402,9 @@ class Lexer:
         '#': TokenType.HASH,
         '$': TokenType.DOLLAR,
     }
+
+    # Backslash escapes in string literals
+    ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"', "'": "'"}
     
     def __init__(self, source: str):
         self.source = source
@@ -421,6 +449,21 @@ class Lexer:
         self._advance()
         return True
     
+    def _skip_to(self, end: int):
+        """Jump to `end`, keeping line/column as repeated _advance() would."""
+        newlines = self.source.count('\n', self.pos, end)
+        if newlines:
+            self.line += newlines
+            self.column = end - self.source.rfind('\n', self.pos, end)
+        else:
+            self.column += end - self.pos
+        self.pos = end
+    
+    def _skip_to_eol(self):
+        """Skip to (not past) the next newline."""
+        end = self.source.find('\n', self.pos)
+        self._skip_to(len(self.source) if end == -1 else end)
+    
     def _skip_whitespace(self):
         """Skip whitespace and comments."""
         while not self._at_end():
@@ -434,22 +477,14 @@ class Lexer:
                 self.tokens.append(Token(TokenType.NEWLINE, '\n', self.line - 1, self.column))
             elif c == '/' and self._peek(1) == '/':
                 # Single-line comment
-                while not self._at_end() and self._peek() != '\n':
-                    self._advance()
+                self._skip_to_eol()
             elif c == '/' and self._peek(1) == '*':
                 # Multi-line comment
-                self._advance()  # /
-                self._advance()  # *
-                while not self._at_end():
-                    if self._peek() == '*' and self._peek(1) == '/':
-                        self._advance()  # *
-                        self._advance()  # /
-                        break
-                    self._advance()
+                end = self.source.find('*/', self.pos + 2)
+                self._skip_to(len(self.source) if end == -1 else end + 2)
             elif c == '#':
                 # Hash comment (Python/Ruby style)
-                while not self._at_end() and self._peek() != '\n':
-                    self._advance()
+                self._skip_to_eol()
             else:
                 break
     
@@ -459,8 +494,8 @@ class Lexer:
         start_col = self.column
         
         # Check multi-char operators first
-        for op, token_type in self.OPERATORS:
-            if self.source[self.pos:self.pos + len(op)] == op:
+        for op, token_type in self.OPERATORS_BY_FIRST.get(self.source[self.pos], ()):
+            if self.source.startswith(op, self.pos):
                 for _ in range(len(op)):
                     self._advance()
                 self.tokens.append(Token(token_type, op, start_line, start_col))
@@ -514,7 +549,17 @@ class Lexer:
             self._advance()
         
         value = []
+        stop = _STRING_STOP_RE[quote, raw, triple]
         while not self._at_end():
+            # Copy plain content up to the next quote/escape/newline in one step
+            m = stop.search(self.source, self.pos)
+            end = m.start() if m else len(self.source)
+            if end > self.pos:
+                value.append(self.source[self.pos:end])
+                self._skip_to(end)
+                if self._at_end():
+                    break
+            
             c = self._peek()
             
             if triple:
@@ -537,8 +582,7 @@ class Lexer:
                 if self._at_end():
                     break
                 escaped = self._advance()
-                escapes = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"', "'": "'"}
-                value.append(escapes.get(escaped, escaped))
+                value.append(self.ESCAPES.get(escaped, escaped))
             else:
                 value.append(self._advance())
         
@@ -629,10 +673,15 @@ class Lexer:
         start_col = self.column
         start_pos = self.pos
         
-        while self._peek().isalnum() or self._peek() == '_':
-            self._advance()
+        # Identifiers never span lines, so one regex match replaces the
+        # per-character _peek/_advance loop.
+        end = _WORD_RE.match(self.source, self.pos).end()
+        self.column += end - self.pos
+        self.pos = end
         
-        text = self.source[start_pos:self.pos]
+        # Interned: scope dicts are keyed by these names, and identical
+        # objects let every variable lookup skip the string compare.
+        text = sys.intern(self.source[start_pos:self.pos])
         
         # Check for step keywords (_filter, _sort, etc.)
         if text in self.STEP_KEYWORDS:
@@ -79,7 +79,7 @@ class NodeType(Enum):
 @dataclass
 class ASTNode:
     """Base AST node."""
-    type: NodeType = None  # Will be set by subclass __post_init__
+    type: NodeType = None  # Each subclass overrides this default
     line: int = 0
     column: int = 0
     
@@ -94,140 +94,112 @@ class ASTNode:
 @dataclass
 class Program(ASTNode):
     """Root program node."""
+    type: NodeType = NodeType.PROGRAM
     statements: List[ASTNode] = field(default_factory=list)
-    
-    def __post_init__(self):
-        self.type = NodeType.PROGRAM
 
 
 @dataclass
 class Literal(ASTNode):
     """Literal value (number, string, bool, null)."""
+    type: NodeType = NodeType.LITERAL
     value: Any = None
-    
-    def __post_init__(self):
-        self.type = NodeType.LITERAL
 
 
 @dataclass
 class Identifier(ASTNode):
     """Variable or function name."""
+    type: NodeType = NodeType.IDENTIFIER
     name: str = ""
-    
-    def __post_init__(self):
-        self.type = NodeType.IDENTIFIER
 
 
 @dataclass
 class BinaryOp(ASTNode):
     """Binary operation."""
+    type: NodeType = NodeType.BINARY_OP
     op: str = ""
     left: ASTNode = None
     right: ASTNode = None
-    
-    def __post_init__(self):
-        self.type = NodeType.BINARY_OP
 
 
 @dataclass
 class UnaryOp(ASTNode):
     """Unary operation."""
+    type: NodeType = NodeType.UNARY_OP
     op: str = ""
     operand: ASTNode = None
     prefix: bool = True
-    
-    def __post_init__(self):
-        self.type = NodeType.UNARY_OP
 
 
 @dataclass
 class Call(ASTNode):
     """Function call."""
+    type: NodeType = NodeType.CALL
     callee: ASTNode = None
     args: List[ASTNode] = field(default_factory=list)
-    
-    def __post_init__(self):
-        self.type = NodeType.CALL
 
 
 @dataclass
 class Index(ASTNode):
     """Array/map index access."""
+    type: NodeType = NodeType.INDEX
     obj: ASTNode = None
     index: ASTNode = None
-    
-    def __post_init__(self):
-        self.type = NodeType.INDEX
 
 
 @dataclass 
 class Member(ASTNode):
     """Member access (obj.field)."""
+    type: NodeType = NodeType.MEMBER
     obj: ASTNode = None
     field: str = ""
-    
-    def __post_init__(self):
-        self.type = NodeType.MEMBER
 
 
 @dataclass
 class Array(ASTNode):
     """Array literal."""
+    type: NodeType = NodeType.ARRAY
     elements: List[ASTNode] = field(default_factory=list)
-    
-    def __post_init__(self):
-        self.type = NodeType.ARRAY
 
 
 @dataclass
 class MapLiteral(ASTNode):
     """Map/dict literal."""
+    type: NodeType = NodeType.MAP_LITERAL
     pairs: List[tuple] = field(default_factory=list)  # [(key, value), ...]
-    
-    def __post_init__(self):
-        self.type = NodeType.MAP_LITERAL
 
 
 @dataclass
 class Lambda(ASTNode):
     """Lambda/anonymous function."""
+    type: NodeType = NodeType.LAMBDA
     params: List[str] = field(default_factory=list)
     body: ASTNode = None
-    
-    def __post_init__(self):
-        self.type = NodeType.LAMBDA
 
 
 @dataclass
 class Conditional(ASTNode):
     """Ternary conditional (cond ? then : else)."""
+    type: NodeType = NodeType.CONDITIONAL
     condition: ASTNode = None
     then_expr: ASTNode = None
     else_expr: ASTNode = None
-    
-    def __post_init__(self):
-        self.type = NodeType.CONDITIONAL
 
 
 @dataclass
 class Range(ASTNode):
     """Range expression (start..end or start..=end)."""
+    type: NodeType = NodeType.RANGE
     start: ASTNode = None
     end: ASTNode = None
     inclusive: bool = False
-    
-    def __post_init__(self):
-        self.type = NodeType.RANGE
 
 
 @dataclass
 class Pipe(ASTNode):
     """Pipe expression (x |> f)."""
+    type: NodeType = NodeType.PIPE
     left: ASTNode = None
     right: ASTNode = None
-    
-    def __post_init__(self):
-        self.type = NodeType.PIPE
 
 
 @dataclass
@@ -237,187 +209,153 @@ class StepChain(ASTNode):
     
     data _filter(x > 5) _sort _take(3)
     """
+    type: NodeType = NodeType.STEP_CHAIN
     source: ASTNode = None  # The data source
     steps: List[tuple] = field(default_factory=list)  # [(step_name, args), ...]
     dotted: bool = False
-    
-    def __post_init__(self):
-        self.type = NodeType.STEP_CHAIN
 
 
 @dataclass
 class LetStmt(ASTNode):
     """Variable declaration."""
+    type: NodeType = NodeType.LET_STMT
     name: str = ""
     type_hint: Optional[str] = None
     value: Optional[ASTNode] = None
     mutable: bool = True
-    
-    def __post_init__(self):
-        self.type = NodeType.LET_STMT
 
 
 @dataclass
 class ConstStmt(ASTNode):
     """Constant declaration."""
+    type: NodeType = NodeType.CONST_STMT
     name: str = ""
     value: ASTNode = None
-    
-    def __post_init__(self):
-        self.type = NodeType.CONST_STMT
 
 
 @dataclass
 class AssignStmt(ASTNode):
     """Assignment."""
+    type: NodeType = NodeType.ASSIGN
     target: ASTNode = None
     value: ASTNode = None
     op: str = "="  # =, +=, -=, etc.
-    
-    def __post_init__(self):
-        self.type = NodeType.ASSIGN
 
 
 @dataclass
 class Block(ASTNode):
     """Block of statements."""
+    type: NodeType = NodeType.BLOCK_STMT
     statements: List[ASTNode] = field(default_factory=list)
-    
-    def __post_init__(self):
-        self.type = NodeType.BLOCK_STMT
 
 
 @dataclass
 class IfStmt(ASTNode):
     """If statement."""
+    type: NodeType = NodeType.IF_STMT
     condition: ASTNode = None
     then_branch: ASTNode = None
     elif_branches: List[tuple] = field(default_factory=list)  # [(cond, body), ...]
     else_branch: Optional[ASTNode] = None
-    
-    def __post_init__(self):
-        self.type = NodeType.IF_STMT
 
 
 @dataclass
 class ForStmt(ASTNode):
     """For loop (bounded iteration)."""
+    type: NodeType = NodeType.FOR_STMT
     var: str = ""
     iterable: ASTNode = None
     body: ASTNode = None
-    
-    def __post_init__(self):
-        self.type = NodeType.FOR_STMT
 
 
 @dataclass
 class WhileStmt(ASTNode):
     """While loop (with implicit bound)."""
+    type: NodeType = NodeType.WHILE_STMT
     condition: ASTNode = None
     body: ASTNode = None
-    
-    def __post_init__(self):
-        self.type = NodeType.WHILE_STMT
 
 
 @dataclass
 class ReturnStmt(ASTNode):
     """Return statement."""
+    type: NodeType = NodeType.RETURN_STMT
     value: Optional[ASTNode] = None
-    
-    def __post_init__(self):
-        self.type = NodeType.RETURN_STMT
 
 
 @dataclass
 class BreakStmt(ASTNode):
     """Break statement."""
-    def __post_init__(self):
-        self.type = NodeType.BREAK_STMT
+    type: NodeType = NodeType.BREAK_STMT
 
 
 @dataclass
 class ContinueStmt(ASTNode):
     """Continue statement."""
-    def __post_init__(self):
-        self.type = NodeType.CONTINUE_STMT
+    type: NodeType = NodeType.CONTINUE_STMT
 
 
 @dataclass
 class FnDecl(ASTNode):
     """Function declaration."""
+    type: NodeType = NodeType.FN_DECL
     name: str = ""
     params: List[tuple] = field(default_factory=list)  # [(name, type_hint), ...]
     return_type: Optional[str] = None
     body: ASTNode = None
     is_async: bool = False
     is_pub: bool = False
-    
-    def __post_init__(self):
-        self.type = NodeType.FN_DECL
 
 
 @dataclass
 class StructDecl(ASTNode):
     """Struct/Blueprint declaration."""
+    type: NodeType = NodeType.STRUCT_DECL
     name: str = ""
     fields: List[tuple] = field(default_factory=list)  # [(name, type, default), ...]
     methods: List[tuple] = field(default_factory=list)  # [('forge'/'law', FnDecl), ...]
     is_pub: bool = False
-    
-    def __post_init__(self):
-        self.type = NodeType.STRUCT_DECL
 
 
 @dataclass
 class EnumDecl(ASTNode):
     """Enum declaration."""
+    type: NodeType = NodeType.ENUM_DECL
     name: str = ""
     variants: List[tuple] = field(default_factory=list)  # [(name, value), ...]
-    
-    def __post_init__(self):
-        self.type = NodeType.ENUM_DECL
 
 
 @dataclass
 class ImportStmt(ASTNode):
     """Import statement."""
+    type: NodeType = NodeType.IMPORT_STMT
     module: str = ""
     items: List[str] = field(default_factory=list)  # Empty = import all
     alias: Optional[str] = None
-    
-    def __post_init__(self):
-        self.type = NodeType.IMPORT_STMT
 
 
 @dataclass
 class MatchStmt(ASTNode):
     """Match/pattern matching statement."""
+    type: NodeType = NodeType.MATCH_STMT
     value: ASTNode = None
     cases: List[tuple] = field(default_factory=list)  # [(pattern, body), ...]
-    
-    def __post_init__(self):
-        self.type = NodeType.MATCH_STMT
 
 
 @dataclass
 class TryStmt(ASTNode):
     """Try-catch statement."""
+    type: NodeType = NodeType.TRY_STMT
     body: ASTNode = None
     catch_var: Optional[str] = None
     catch_body: Optional[ASTNode] = None
-    
-    def __post_init__(self):
-        self.type = NodeType.TRY_STMT
 
 
 @dataclass
 class ThrowStmt(ASTNode):
     """Throw statement."""
+    type: NodeType = NodeType.THROW_STMT
     value: ASTNode = None
-    
-    def __post_init__(self):
-        self.type = NodeType.THROW_STMT
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1475,7 +1413,7 @@ class Parser:
                         body = self._parse_expression()
                         return Lambda(params=params, body=body,
                                        line=tok.line, column=tok.column)
-                except:
+                except SyntaxError:
                     pass
                 
                 # Not a lambda, backtrack
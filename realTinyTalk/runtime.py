@@ -8,11 +8,14 @@ Every step is traced. Every result is verified.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Callable, Tuple
+import re
 import time
 
 from .kernel import ExecutionBounds, Trace, Ledger, fin, finfr
-from .types import Value, ValueType, TinyType
+from . import stdlib
+from .types import Value, ValueType, TinyType, NUMERIC_TYPES, CONTAINER_TYPES
 from .parser import (
     Program, Literal, Identifier, BinaryOp, UnaryOp, Call, Index, Member,
     Array, MapLiteral, Lambda, Conditional, Range, Pipe, LetStmt, ConstStmt,
@@ -22,6 +25,14 @@ from .parser import (
 )
 
 
+@lru_cache(maxsize=256)
+def _wildcard_regex(pattern: str) -> 're.Pattern':
+    """Compile an islike wildcard pattern (* and ?) once per distinct pattern."""
+    # Escape regex special chars except * and ?
+    pattern = re.escape(pattern).replace(r'\*', '.*').replace(r'\?', '.')
+    return re.compile(pattern, re.IGNORECASE)
+
+
 class BreakException(Exception):
     """Break out of loop."""
     pass
@@ -144,6 +155,66 @@ class EnumVariant:
     data: Optional[Value] = None
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# BUILTINS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Built once at import; every Runtime (one per /api/run) binds these into its
+# global scope instead of rebuilding the table.
+BUILTINS = {
+    # show is the primary way to print - friendly, auto-converts
+    'show': stdlib.builtin_show,
+    'print': stdlib.builtin_print,
+    'println': stdlib.builtin_show,  # alias for show
+    'len': stdlib.builtin_len,
+    'type': stdlib.builtin_type,
+    'str': stdlib.builtin_str,
+    'int': stdlib.builtin_int,
+    'float': stdlib.builtin_float,
+    'bool': stdlib.builtin_bool,
+    'list': stdlib.builtin_list,
+    'map': stdlib.builtin_map,
+    'range': stdlib.builtin_range,
+    'sum': stdlib.builtin_sum,
+    'min': stdlib.builtin_min,
+    'max': stdlib.builtin_max,
+    'abs': stdlib.builtin_abs,
+    'round': stdlib.builtin_round,
+    'floor': stdlib.builtin_floor,
+    'ceil': stdlib.builtin_ceil,
+    'sqrt': stdlib.builtin_sqrt,
+    'pow': stdlib.builtin_pow,
+    'sin': stdlib.builtin_sin,
+    'cos': stdlib.builtin_cos,
+    'tan': stdlib.builtin_tan,
+    'log': stdlib.builtin_log,
+    'exp': stdlib.builtin_exp,
+    'input': stdlib.builtin_input,
+    'split': stdlib.builtin_split,
+    'join': stdlib.builtin_join,
+    'append': stdlib.builtin_append,
+    'pop': stdlib.builtin_pop,
+    'push': stdlib.builtin_push,
+    'keys': stdlib.builtin_keys,
+    'values': stdlib.builtin_values,
+    'contains': stdlib.builtin_contains,
+    'slice': stdlib.builtin_slice,
+    'reverse': stdlib.builtin_reverse,
+    'sort': stdlib.builtin_sort,
+    'filter': stdlib.builtin_filter,
+    'map_': stdlib.builtin_map_fn,
+    'reduce': stdlib.builtin_reduce,
+    'zip': stdlib.builtin_zip,
+    'enumerate': stdlib.builtin_enumerate,
+    'assert': stdlib.builtin_assert,
+    'assert_equal': stdlib.builtin_assert_equal,
+    'assert_true': stdlib.builtin_assert_true,
+    'assert_false': stdlib.builtin_assert_false,
+    'typeof': stdlib.builtin_typeof,
+    'hash': stdlib.builtin_hash,
+}
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # RUNTIME
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -153,10 +224,12 @@ class Runtime:
     TinyTalk runtime interpreter.
     
     Executes AST with bounded computation and full tracing.
+    Pass trace=False when nothing will read `traces`.
     """
     
-    def __init__(self, bounds: Optional[ExecutionBounds] = None):
+    def __init__(self, bounds: Optional[ExecutionBounds] = None, trace: bool = True):
         self.bounds = bounds or ExecutionBounds()
+        self.trace_enabled = trace
         self.global_scope = Scope()
         self.structs: Dict[str, TinyStruct] = {}
         self.enums: Dict[str, TinyEnum] = {}
@@ -168,69 +241,50 @@ class Runtime:
         self.iteration_count = 0
         self.recursion_depth = 0
         self.start_time = 0.0
+        self._deadline = 0.0
+        
+        # Node type -> handler, bound once so _eval is a single dict lookup
+        self._dispatch = {
+            Program: self._eval_program,
+            Literal: self._eval_literal,
+            Identifier: self._eval_identifier,
+            BinaryOp: self._eval_binary,
+            UnaryOp: self._eval_unary,
+            Call: self._eval_call,
+            Index: self._eval_index,
+            Member: self._eval_member,
+            Array: self._eval_array,
+            MapLiteral: self._eval_map_literal,
+            Lambda: self._eval_lambda,
+            Conditional: self._eval_conditional,
+            Range: self._eval_range,
+            Pipe: self._eval_pipe,
+            StepChain: self._eval_step_chain,
+            LetStmt: self._eval_let,
+            ConstStmt: self._eval_const,
+            AssignStmt: self._eval_assign_stmt,
+            Block: self._eval_block,
+            IfStmt: self._eval_if,
+            ForStmt: self._eval_for,
+            WhileStmt: self._eval_while,
+            ReturnStmt: self._eval_return,
+            BreakStmt: self._eval_break,
+            ContinueStmt: self._eval_continue,
+            FnDecl: self._eval_fn_decl,
+            StructDecl: self._eval_struct_decl,
+            EnumDecl: self._eval_enum_decl,
+            ImportStmt: self._eval_import,
+            MatchStmt: self._eval_match,
+            TryStmt: self._eval_try,
+            ThrowStmt: self._eval_throw,
+        }
         
         # Register builtins
         self._register_builtins()
     
     def _register_builtins(self):
         """Register built-in functions."""
-        from . import stdlib
-        
-        builtins = {
-            # show is the primary way to print - friendly, auto-converts
-            'show': stdlib.builtin_show,
-            'print': stdlib.builtin_print,
-            'println': stdlib.builtin_show,  # alias for show
-            'len': stdlib.builtin_len,
-            'type': stdlib.builtin_type,
-            'str': stdlib.builtin_str,
-            'int': stdlib.builtin_int,
-            'float': stdlib.builtin_float,
-            'bool': stdlib.builtin_bool,
-            'list': stdlib.builtin_list,
-            'map': stdlib.builtin_map,
-            'range': stdlib.builtin_range,
-            'sum': stdlib.builtin_sum,
-            'min': stdlib.builtin_min,
-            'max': stdlib.builtin_max,
-            'abs': stdlib.builtin_abs,
-            'round': stdlib.builtin_round,
-            'floor': stdlib.builtin_floor,
-            'ceil': stdlib.builtin_ceil,
-            'sqrt': stdlib.builtin_sqrt,
-            'pow': stdlib.builtin_pow,
-            'sin': stdlib.builtin_sin,
-            'cos': stdlib.builtin_cos,
-            'tan': stdlib.builtin_tan,
-            'log': stdlib.builtin_log,
-            'exp': stdlib.builtin_exp,
-            'input': stdlib.builtin_input,
-            'split': stdlib.builtin_split,
-            'join': stdlib.builtin_join,
-            'append': stdlib.builtin_append,
-            'pop': stdlib.builtin_pop,
-            'push': stdlib.builtin_push,
-            'keys': stdlib.builtin_keys,
-            'values': stdlib.builtin_values,
-            'contains': stdlib.builtin_contains,
-            'slice': stdlib.builtin_slice,
-            'reverse': stdlib.builtin_reverse,
-            'sort': stdlib.builtin_sort,
-            'filter': stdlib.builtin_filter,
-            'map_': stdlib.builtin_map_fn,
-            'reduce': stdlib.builtin_reduce,
-            'zip': stdlib.builtin_zip,
-            'enumerate': stdlib.builtin_enumerate,
-            'assert': stdlib.builtin_assert,
-            'assert_equal': stdlib.builtin_assert_equal,
-            'assert_true': stdlib.builtin_assert_true,
-            'assert_false': stdlib.builtin_assert_false,
-            'typeof': stdlib.builtin_typeof,
-            'hash': stdlib.builtin_hash,
-            'show': stdlib.builtin_show,
-        }
-        
-        for name, fn in builtins.items():
+        for name, fn in BUILTINS.items():
             self.global_scope.define(
                 name,
                 Value.function_val(TinyFunction(name, [], None, self.global_scope, True, fn)),
@@ -243,14 +297,18 @@ class Runtime:
         self.iteration_count = 0
         self.recursion_depth = 0
         self.start_time = time.time()
+        # Monotonic deadline: one clock read and compare per op, immune to wall-clock jumps
+        self._deadline = time.monotonic() + self.bounds.timeout_seconds
         self.traces = []
         
         try:
             result = self._eval(ast, self.global_scope)
-            self.traces.append(Trace.t("execute", True, {"result": str(result)}))
+            if self.trace_enabled:
+                self.traces.append(Trace.t("execute", True, {"result": str(result)}))
             return result
         except ReturnException as e:
-            self.traces.append(Trace.t("return", True, {"value": str(e.value)}))
+            if self.trace_enabled:
+                self.traces.append(Trace.t("return", True, {"value": str(e.value)}))
             return e.value
         except (BreakException, ContinueException):
             raise TinyTalkError("Break/continue outside of loop")
@@ -262,251 +320,195 @@ class Runtime:
         if self.op_count > self.bounds.max_ops:
             raise TinyTalkError(f"Exceeded maximum operations ({self.bounds.max_ops})")
         
-        elapsed = time.time() - self.start_time
-        if elapsed > self.bounds.timeout_seconds:
+        if time.monotonic() > self._deadline:
             raise TinyTalkError(f"Exceeded timeout ({self.bounds.timeout_seconds}s)")
     
     def _eval(self, node, scope: Scope) -> Value:
         """Evaluate an AST node."""
         self._check_bounds()
         
-        # Program
-        if isinstance(node, Program):
-            result = Value.null_val()
-            for stmt in node.statements:
-                result = self._eval(stmt, scope)
-            return result
-        
-        # Literals
-        if isinstance(node, Literal):
-            return self._eval_literal(node)
-        
-        # Identifier
-        if isinstance(node, Identifier):
-            val = scope.get(node.name)
-            if val is None:
-                raise TinyTalkError(f"Undefined variable '{node.name}'", node.line)
-            return val
-        
-        # Binary operations
-        if isinstance(node, BinaryOp):
-            return self._eval_binary(node, scope)
-        
-        # Unary operations
-        if isinstance(node, UnaryOp):
-            return self._eval_unary(node, scope)
-        
-        # Function call
-        if isinstance(node, Call):
-            return self._eval_call(node, scope)
-        
-        # Index access
-        if isinstance(node, Index):
-            return self._eval_index(node, scope)
-        
-        # Member access
-        if isinstance(node, Member):
-            return self._eval_member(node, scope)
-        
-        # Array literal
-        if isinstance(node, Array):
-            elements = [self._eval(el, scope) for el in node.elements]
-            return Value.list_val(elements)
-        
-        # Map literal
-        if isinstance(node, MapLiteral):
-            pairs = {}
-            for key, val in node.pairs:
-                k = self._eval(key, scope)
-                v = self._eval(val, scope)
-                # Use Python-hashable key
-                pairs[k.to_python()] = v
-            return Value.map_val(pairs)
-        
-        # Lambda
-        if isinstance(node, Lambda):
-            params = [(p, None) for p in node.params]
-            return Value.function_val(TinyFunction("<lambda>", params, node.body, scope))
-        
-        # Conditional (ternary)
-        if isinstance(node, Conditional):
-            cond = self._eval(node.condition, scope)
-            if cond.is_truthy():
-                return self._eval(node.then_expr, scope)
-            else:
-                return self._eval(node.else_expr, scope)
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            raise TinyTalkError(f"Unknown node type: {type(node).__name__}")
+        return handler(node, scope)
+    
+    def _eval_program(self, node: Program, scope: Scope) -> Value:
+        """Evaluate a program's statements in order."""
+        result = Value.null_val()
+        for stmt in node.statements:
+            result = self._eval(stmt, scope)
+        return result
+    
+    def _eval_identifier(self, node: Identifier, scope: Scope) -> Value:
+        """Look up a variable."""
+        val = scope.get(node.name)
+        if val is None:
+            raise TinyTalkError(f"Undefined variable '{node.name}'", node.line)
+        return val
+    
+    def _eval_array(self, node: Array, scope: Scope) -> Value:
+        """Evaluate an array literal."""
+        elements = [self._eval(el, scope) for el in node.elements]
+        return Value.list_val(elements)
+    
+    def _eval_map_literal(self, node: MapLiteral, scope: Scope) -> Value:
+        """Evaluate a map literal."""
+        pairs = {}
+        for key, val in node.pairs:
+            k = self._eval(key, scope)
+            v = self._eval(val, scope)
+            # Use Python-hashable key
+            pairs[k.to_python()] = v
+        return Value.map_val(pairs)
+    
+    def _eval_lambda(self, node: Lambda, scope: Scope) -> Value:
+        """Create a closure from a lambda."""
+        params = [(p, None) for p in node.params]
+        return Value.function_val(TinyFunction("<lambda>", params, node.body, scope))
+    
+    def _eval_conditional(self, node: Conditional, scope: Scope) -> Value:
+        """Evaluate a ternary conditional."""
+        cond = self._eval(node.condition, scope)
+        if cond.is_truthy():
+            return self._eval(node.then_expr, scope)
+        else:
+            return self._eval(node.else_expr, scope)
+    
+    def _eval_range(self, node: Range, scope: Scope) -> Value:
+        """Evaluate a range into a list."""
+        start = self._eval(node.start, scope)
+        end = self._eval(node.end, scope)
+        
+        items = []
+        i = start.data
+        end_val = end.data + 1 if node.inclusive else end.data
+        while i < end_val:
+            items.append(Value.int_val(i))
+            i += 1
+        return Value.list_val(items)
+    
+    def _eval_pipe(self, node: Pipe, scope: Scope) -> Value:
+        """Evaluate a pipe: x |> f  becomes  f(x)."""
+        left = self._eval(node.left, scope)
         
-        # Range
-        if isinstance(node, Range):
-            start = self._eval(node.start, scope)
-            end = self._eval(node.end, scope)
-            
-            items = []
-            i = start.data
-            end_val = end.data + 1 if node.inclusive else end.data
-            while i < end_val:
-                items.append(Value.int_val(i))
-                i += 1
-            return Value.list_val(items)
-        
-        # Pipe
-        if isinstance(node, Pipe):
-            # x |> f  becomes  f(x)
-            left = self._eval(node.left, scope)
-            
-            # Right side must be callable or a call
-            if isinstance(node.right, Call):
-                # Insert left as first argument
-                fn = scope.get(node.right.callee.name) if isinstance(node.right.callee, Identifier) else self._eval(node.right.callee, scope)
-                args = [left] + [self._eval(a, scope) for a in node.right.args]
-                return self._call_function(fn.data, args, scope, node.line)
-            elif isinstance(node.right, Identifier):
-                fn = scope.get(node.right.name)
-                if fn is None:
-                    raise TinyTalkError(f"Undefined function '{node.right.name}'", node.line)
-                return self._call_function(fn.data, [left], scope, node.line)
+        # Right side must be callable or a call
+        if isinstance(node.right, Call):
+            # Insert left as first argument
+            fn = scope.get(node.right.callee.name) if isinstance(node.right.callee, Identifier) else self._eval(node.right.callee, scope)
+            args = [left]
+            args.extend(self._eval(a, scope) for a in node.right.args)
+            return self._call_function(fn.data, args, scope, node.line)
+        elif isinstance(node.right, Identifier):
+            fn = scope.get(node.right.name)
+            if fn is None:
+                raise TinyTalkError(f"Undefined function '{node.right.name}'", node.line)
+            return self._call_function(fn.data, [left], scope, node.line)
+        else:
+            fn = self._eval(node.right, scope)
+            return self._call_function(fn.data, [left], scope, node.line)
+    
+    def _eval_let(self, node: LetStmt, scope: Scope) -> Value:
+        """Evaluate a let statement."""
+        val = self._eval(node.value, scope) if node.value else Value.null_val()
+        scope.define(node.name, val, const=False)
+        return val
+    
+    def _eval_const(self, node: ConstStmt, scope: Scope) -> Value:
+        """Evaluate a const statement."""
+        val = self._eval(node.value, scope) if node.value else Value.null_val()
+        scope.define(node.name, val, const=True)
+        return val
+    
+    def _eval_assign_stmt(self, node: AssignStmt, scope: Scope) -> Value:
+        """Evaluate an assignment statement."""
+        val = self._eval(node.value, scope)
+        
+        if isinstance(node.target, Identifier):
+            if node.op == '=':
+                if not scope.set(node.target.name, val):
+                    scope.define(node.target.name, val)
             else:
-                fn = self._eval(node.right, scope)
-                return self._call_function(fn.data, [left], scope, node.line)
-        
-        # Step chain (dplyr-style: data _filter _sort _take)
-        if isinstance(node, StepChain):
-            return self._eval_step_chain(node, scope)
-        
-        # Let statement
-        if isinstance(node, LetStmt):
-            val = self._eval(node.value, scope) if node.value else Value.null_val()
-            scope.define(node.name, val, const=False)
-            return val
-        
-        # Const statement
-        if isinstance(node, ConstStmt):
-            val = self._eval(node.value, scope) if node.value else Value.null_val()
-            scope.define(node.name, val, const=True)
-            return val
-        
-        # Assignment statement
-        if isinstance(node, AssignStmt):
-            val = self._eval(node.value, scope)
-            
-            if isinstance(node.target, Identifier):
-                if node.op == '=':
-                    if not scope.set(node.target.name, val):
-                        scope.define(node.target.name, val)
-                else:
-                    # Compound assignment
-                    old_val = scope.get(node.target.name)
-                    op = node.op[:-1]  # Remove '=' from '+=', '-=', etc.
-                    new_val = self._apply_op(old_val, val, op, node.line)
-                    scope.set(node.target.name, new_val)
-                    return new_val
-            elif isinstance(node.target, Index):
-                container = self._eval(node.target.obj, scope)
-                index = self._eval(node.target.index, scope)
-                if container.type == ValueType.LIST:
-                    container.data[int(index.data)] = val
-                elif container.type == ValueType.MAP:
-                    container.data[index.to_python()] = val
-            elif isinstance(node.target, Member):
-                obj = self._eval(node.target.obj, scope)
-                if obj.type == ValueType.STRUCT_INSTANCE:
-                    obj.data.fields[node.target.field] = val
-                elif obj.type == ValueType.MAP:
-                    obj.data[node.target.field] = val
-            return val
-        
-        # Block
-        if isinstance(node, Block):
-            block_scope = Scope(scope)
-            result = Value.null_val()
-            for stmt in node.statements:
-                result = self._eval(stmt, block_scope)
-            return result
-        
-        # If statement
-        if isinstance(node, IfStmt):
-            return self._eval_if(node, scope)
-        
-        # For loop
-        if isinstance(node, ForStmt):
-            return self._eval_for(node, scope)
-        
-        # While loop
-        if isinstance(node, WhileStmt):
-            return self._eval_while(node, scope)
-        
-        # Return
-        if isinstance(node, ReturnStmt):
-            val = self._eval(node.value, scope) if node.value else Value.null_val()
-            raise ReturnException(val)
-        
-        # Break
-        if isinstance(node, BreakStmt):
-            raise BreakException()
-        
-        # Continue
-        if isinstance(node, ContinueStmt):
-            raise ContinueException()
-        
-        # Function declaration
-        if isinstance(node, FnDecl):
-            fn = TinyFunction(node.name, node.params, node.body, scope)
-            scope.define(node.name, Value.function_val(fn), const=True)
-            return Value.null_val()
-        
-        # Struct declaration (blueprint)
-        if isinstance(node, StructDecl):
-            # Build methods dict from parsed methods
-            methods = {}
-            for kind, method_decl in node.methods:
-                method_fn = TinyFunction(
-                    method_decl.name,
-                    method_decl.params,
-                    method_decl.body,
-                    scope  # closure captures the scope at definition time
-                )
-                methods[method_decl.name] = method_fn
-            
-            struct = TinyStruct(node.name, node.fields, methods)
-            self.structs[node.name] = struct
-            
-            # Define constructor
-            scope.define(node.name, Value.function_val(
-                TinyFunction(node.name, [(f[0], f[1]) for f in node.fields], None, scope, True,
-                            lambda args, s=struct: self._construct_struct(s, args))
-            ), const=True)
-            return Value.null_val()
-        
-        # Enum declaration
-        if isinstance(node, EnumDecl):
-            enum = TinyEnum(node.name, node.variants)
-            self.enums[node.name] = enum
-            return Value.null_val()
-        
-        # Import
-        if isinstance(node, ImportStmt):
-            return self._eval_import(node, scope)
-        
-        # Match
-        if isinstance(node, MatchStmt):
-            return self._eval_match(node, scope)
-        
-        # Try
-        if isinstance(node, TryStmt):
-            return self._eval_try(node, scope)
-        
-        # Throw
-        if isinstance(node, ThrowStmt):
-            val = self._eval(node.value, scope) if node.value else Value.null_val()
-            raise TinyTalkError(str(val.data), node.line)
+                # Compound assignment
+                old_val = scope.get(node.target.name)
+                op = node.op[:-1]  # Remove '=' from '+=', '-=', etc.
+                new_val = self._apply_op(old_val, val, op, node.line)
+                scope.set(node.target.name, new_val)
+                return new_val
+        elif isinstance(node.target, Index):
+            container = self._eval(node.target.obj, scope)
+            index = self._eval(node.target.index, scope)
+            if container.type == ValueType.LIST:
+                container.data[int(index.data)] = val
+            elif container.type == ValueType.MAP:
+                container.data[index.to_python()] = val
+        elif isinstance(node.target, Member):
+            obj = self._eval(node.target.obj, scope)
+            if obj.type == ValueType.STRUCT_INSTANCE:
+                obj.data.fields[node.target.field] = val
+            elif obj.type == ValueType.MAP:
+                obj.data[node.target.field] = val
+        return val
+    
+    def _eval_block(self, node: Block, scope: Scope) -> Value:
+        """Evaluate a block in a new scope."""
+        block_scope = Scope(scope)
+        result = Value.null_val()
+        for stmt in node.statements:
+            result = self._eval(stmt, block_scope)
+        return result
+    
+    def _eval_return(self, node: ReturnStmt, scope: Scope) -> Value:
+        """Evaluate a return statement."""
+        val = self._eval(node.value, scope) if node.value else Value.null_val()
+        raise ReturnException(val)
+    
+    def _eval_break(self, node: BreakStmt, scope: Scope) -> Value:
+        raise BreakException()
+    
+    def _eval_continue(self, node: ContinueStmt, scope: Scope) -> Value:
+        raise ContinueException()
+    
+    def _eval_fn_decl(self, node: FnDecl, scope: Scope) -> Value:
+        """Evaluate a function declaration."""
+        fn = TinyFunction(node.name, node.params, node.body, scope)
+        scope.define(node.name, Value.function_val(fn), const=True)
+        return Value.null_val()
+    
+    def _eval_struct_decl(self, node: StructDecl, scope: Scope) -> Value:
+        """Evaluate a struct declaration (blueprint)."""
+        # Build methods dict from parsed methods
+        methods = {}
+        for kind, method_decl in node.methods:
+            method_fn = TinyFunction(
+                method_decl.name,
+                method_decl.params,
+                method_decl.body,
+                scope  # closure captures the scope at definition time
+            )
+            methods[method_decl.name] = method_fn
         
-        # Assignment (binary =)
-        if isinstance(node, BinaryOp) and node.op == '=':
-            return self._eval_assignment(node, scope)
+        struct = TinyStruct(node.name, node.fields, methods)
+        self.structs[node.name] = struct
         
-        raise TinyTalkError(f"Unknown node type: {type(node).__name__}")
+        # Define constructor
+        scope.define(node.name, Value.function_val(
+            TinyFunction(node.name, [(f[0], f[1]) for f in node.fields], None, scope, True,
+                        lambda args, s=struct: self._construct_struct(s, args))
+        ), const=True)
+        return Value.null_val()
     
-    def _eval_literal(self, node: Literal) -> Value:
+    def _eval_enum_decl(self, node: EnumDecl, scope: Scope) -> Value:
+        """Evaluate an enum declaration."""
+        enum = TinyEnum(node.name, node.variants)
+        self.enums[node.name] = enum
+        return Value.null_val()
+    
+    def _eval_throw(self, node: ThrowStmt, scope: Scope) -> Value:
+        """Evaluate a throw statement."""
+        val = self._eval(node.value, scope) if node.value else Value.null_val()
+        raise TinyTalkError(str(val.data), node.line)
+    
+    def _eval_literal(self, node: Literal, scope: Scope) -> Value:
         """Evaluate a literal."""
         val = node.value
         if val is None:
@@ -641,17 +643,11 @@ class Runtime:
         
         # islike - pattern matching (simple wildcard or regex-lite)
         if op == 'islike':
-            import re
             if left.type != ValueType.STRING or right.type != ValueType.STRING:
                 return Value.bool_val(False)
-            # Convert simple wildcards to regex
-            pattern = right.data
-            # Escape regex special chars except * and ?
-            pattern = re.escape(pattern)
-            pattern = pattern.replace(r'\*', '.*').replace(r'\?', '.')
             try:
-                return Value.bool_val(bool(re.fullmatch(pattern, left.data, re.IGNORECASE)))
-            except:
+                return Value.bool_val(bool(_wildcard_regex(right.data).fullmatch(left.data)))
+            except re.error:
                 return Value.bool_val(False)
         
         # Bitwise
@@ -978,9 +974,9 @@ class Runtime:
                     if '.' in obj.data:
                         return Value.float_val(float(obj.data))
                     return Value.int_val(int(obj.data))
-                except:
+                except (ValueError, OverflowError):
                     return Value.int_val(0)
-            if obj.type in (ValueType.INT, ValueType.FLOAT):
+            if obj.type in NUMERIC_TYPES:
                 return obj
             if obj.type == ValueType.BOOLEAN:
                 return Value.int_val(1 if obj.data else 0)
@@ -990,9 +986,9 @@ class Runtime:
             if obj.type == ValueType.STRING:
                 try:
                     return Value.int_val(int(float(obj.data)))
-                except:
+                except (ValueError, OverflowError):
                     return Value.int_val(0)
-            if obj.type in (ValueType.INT, ValueType.FLOAT):
+            if obj.type in NUMERIC_TYPES:
                 return Value.int_val(int(obj.data))
             if obj.type == ValueType.BOOLEAN:
                 return Value.int_val(1 if obj.data else 0)
@@ -1002,9 +998,9 @@ class Runtime:
             if obj.type == ValueType.STRING:
                 try:
                     return Value.float_val(float(obj.data))
-                except:
+                except (ValueError, OverflowError):
                     return Value.float_val(0.0)
-            if obj.type in (ValueType.INT, ValueType.FLOAT):
+            if obj.type in NUMERIC_TYPES:
                 return Value.float_val(float(obj.data))
             return Value.float_val(0.0)
         
@@ -1063,7 +1059,7 @@ class Runtime:
             seen = set()
         
         # Check for circular reference
-        val_id = id(val.data) if val.type in (ValueType.LIST, ValueType.MAP) else None
+        val_id = id(val.data) if val.type in CONTAINER_TYPES else None
         if val_id is not None:
             if val_id in seen:
                 return "[circular]" if val.type == ValueType.LIST else "{circular}"
@@ -1209,11 +1205,13 @@ class Runtime:
             pred = args[0]
             if pred.type != ValueType.FUNCTION:
                 raise TinyTalkError("_filter argument must be a function", line)
+            # Bind per-item lookups once; this loop runs for every element
+            call, pred_fn = self._call_function, pred.data
             result = []
+            append = result.append
             for item in items:
-                res = self._call_function(pred.data, [item], scope, line)
-                if res.is_truthy():
-                    result.append(item)
+                if call(pred_fn, [item], scope, line).is_truthy():
+                    append(item)
             return Value.list_val(result)
         
         # _sort - Sort the list (optionally with key function)
@@ -1232,7 +1230,8 @@ class Runtime:
             fn = args[0]
             if fn.type != ValueType.FUNCTION:
                 raise TinyTalkError("_map argument must be a function", line)
-            result = [self._call_function(fn.data, [item], scope, line) for item in items]
+            call, fn_data = self._call_function, fn.data
+            result = [call(fn_data, [item], scope, line) for item in items]
             return Value.list_val(result)
         
         # _take(n) - Take first n items
@@ -1274,20 +1273,30 @@ class Runtime:
         # _count - Count items (or count matching predicate)
         if step == '_count':
             if args and args[0].type == ValueType.FUNCTION:
-                pred = args[0]
-                count = sum(1 for item in items if self._call_function(pred.data, [item], scope, line).is_truthy())
+                call, pred_fn = self._call_function, args[0].data
+                count = sum(1 for item in items if call(pred_fn, [item], scope, line).is_truthy())
             else:
                 count = len(items)
             return Value.int_val(count)
         
         # _sum - Sum numeric values
         if step == '_sum':
-            total = sum(item.data for item in items if item.type in (ValueType.INT, ValueType.FLOAT))
-            return Value.float_val(total) if any(item.type == ValueType.FLOAT for item in items) else Value.int_val(int(total))
+            # One pass: accumulate and note whether any float was seen
+            total = 0
+            has_float = False
+            INT, FLOAT = ValueType.INT, ValueType.FLOAT
+            for item in items:
+                t = item.type
+                if t is INT:
+                    total += item.data
+                elif t is FLOAT:
+                    total += item.data
+                    has_float = True
+            return Value.float_val(total) if has_float else Value.int_val(int(total))
         
         # _avg - Average of numeric values
         if step == '_avg':
-            nums = [item.data for item in items if item.type in (ValueType.INT, ValueType.FLOAT)]
+            nums = [item.data for item in items if item.type in NUMERIC_TYPES]
             if not nums:
                 return Value.null_val()
             return Value.float_val(sum(nums) / len(nums))
@@ -11,7 +11,7 @@ from typing import List, Any
 import math
 import hashlib
 
-from .types import Value, ValueType
+from .types import Value, ValueType, NUMERIC_TYPES, CONTAINER_TYPES
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -52,7 +52,7 @@ def _format_value(val: Value, seen: set = None) -> str:
         seen = set()
     
     # Check for circular reference
-    val_id = id(val.data) if val.type in (ValueType.LIST, ValueType.MAP) else None
+    val_id = id(val.data) if val.type in CONTAINER_TYPES else None
     if val_id is not None:
         if val_id in seen:
             return "[circular]" if val.type == ValueType.LIST else "{circular}"
@@ -463,7 +463,7 @@ def builtin_sum(args: List[Value]) -> Value:
     if not args or args[0].type != ValueType.LIST:
         return Value.int_val(0)
     
-    total = sum(v.data for v in args[0].data if v.type in (ValueType.INT, ValueType.FLOAT))
+    total = sum(v.data for v in args[0].data if v.type in NUMERIC_TYPES)
     if isinstance(total, float):
         return Value.float_val(total)
     return Value.int_val(total)
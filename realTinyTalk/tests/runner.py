@@ -70,7 +70,7 @@ FILE_CATEGORIES = {
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of a single test."""
     name: str
@@ -86,7 +86,7 @@ class TestResult:
     category: TestCategory = TestCategory.CORE
 
 
-@dataclass
+@dataclass(slots=True)
 class SuiteResult:
     """Result of a test suite."""
     name: str
@@ -242,13 +242,18 @@ def run_test(name: str, code: str, expected: str, file: str, line: int,
         )
 
 
-def run_suite(path: Path) -> SuiteResult:
-    """Run all tests in a file."""
+def run_suite(path: Path, name_filter: Optional[str] = None) -> SuiteResult:
+    """Run all tests in a file, or only those whose name matches `name_filter`."""
     start = time.time()
     
     content = path.read_text(encoding='utf-8')
     tests = parse_test_file(content, path.name)
     
+    # Filter before running so unmatched tests are never executed
+    if name_filter:
+        pattern = f'*{name_filter.lower()}*'
+        tests = [t for t in tests if fnmatch.fnmatch(t[0].lower(), pattern)]
+    
     # Get category
     stem = path.stem
     category = FILE_CATEGORIES.get(stem, TestCategory.CORE)
@@ -279,15 +284,18 @@ def format_diff(expected: str, actual: str, max_len: int = 60) -> str:
     act_lines = actual.split('\n')
     
     # Show first difference
-    for i, (e, a) in enumerate(zip(exp_lines, act_lines)):
-        if e.strip() != a.strip():
-            lines.append(f"  line {i+1}:")
-            lines.append(f"    expected: {repr(e[:max_len])}")
-            lines.append(f"    actual:   {repr(a[:max_len])}")
-            break
-    else:
-        if len(exp_lines) != len(act_lines):
-            lines.append(f"  expected {len(exp_lines)} lines, got {len(act_lines)}")
+    first = next(
+        ((i, e, a) for i, (e, a) in enumerate(zip(exp_lines, act_lines))
+         if e.strip() != a.strip()),
+        None
+    )
+    if first is not None:
+        i, e, a = first
+        lines.append(f"  line {i+1}:")
+        lines.append(f"    expected: {repr(e[:max_len])}")
+        lines.append(f"    actual:   {repr(a[:max_len])}")
+    elif len(exp_lines) != len(act_lines):
+        lines.append(f"  expected {len(exp_lines)} lines, got {len(act_lines)}")
     
     return '\n'.join(lines)
 
@@ -333,77 +341,83 @@ def print_results(suites: List[SuiteResult], verbose: bool = False,
     total_failed = 0
     total_time = 0.0
     all_failures: List[TestResult] = []
+    lines: List[str] = []
     
     # Category stats
     category_stats: Dict[TestCategory, Tuple[int, int]] = {}
     
-    print()
-    print("=" * 65)
-    print("  realTinyTalk v1.0 CONFORMANCE TEST RESULTS")
-    print("=" * 65)
-    print()
+    lines.append("")
+    lines.append("=" * 65)
+    lines.append("  realTinyTalk v1.0 CONFORMANCE TEST RESULTS")
+    lines.append("=" * 65)
+    lines.append("")
     
     for suite in suites:
-        status = "[PASS]" if suite.failed == 0 else "[FAIL]"
+        # One pass collects the failures; both counts follow from it
+        failures = [r for r in suite.results if not r.passed]
+        total = suite.total
+        failed = len(failures)
+        passed = total - failed
+        status = "[PASS]" if failed == 0 else "[FAIL]"
         cat_label = f"[{suite.category.value}]"
         
-        print(f"{status} {cat_label:8} {suite.name}: {suite.passed}/{suite.total} ({suite.time_ms:.1f}ms)")
+        lines.append(f"{status} {cat_label:8} {suite.name}: {passed}/{total} ({suite.time_ms:.1f}ms)")
         
         # Track category stats
         cat = suite.category
         prev = category_stats.get(cat, (0, 0))
-        category_stats[cat] = (prev[0] + suite.passed, prev[1] + suite.total)
+        category_stats[cat] = (prev[0] + passed, prev[1] + total)
         
         if verbose:
             for result in suite.results:
                 status = "[PASS]" if result.passed else "[FAIL]"
-                print(f"    {status} {result.name}")
+                lines.append(f"    {status} {result.name}")
         
-        # Collect failures
-        for result in suite.results:
-            if not result.passed:
-                all_failures.append(result)
+        all_failures.extend(failures)
         
-        total_passed += suite.passed
-        total_failed += suite.failed
+        total_passed += passed
+        total_failed += failed
         total_time += suite.time_ms
     
     # Print category summary
-    print()
-    print("-" * 65)
-    print("  Category Summary:")
+    lines.append("")
+    lines.append("-" * 65)
+    lines.append("  Category Summary:")
     for cat in TestCategory:
         if cat in category_stats:
             passed, total = category_stats[cat]
             pct = (passed / total * 100) if total > 0 else 0
             status = "[OK]" if passed == total else "[!!]"
-            print(f"    {status} {cat.value:8}: {passed}/{total} ({pct:.0f}%)")
+            lines.append(f"    {status} {cat.value:8}: {passed}/{total} ({pct:.0f}%)")
     
     # Print failures (up to max)
     if all_failures:
-        print()
-        print("-" * 65)
-        print(f"  FAILURES ({len(all_failures)} total, showing first {min(len(all_failures), max_failures)}):")
-        print()
+        lines.append("")
+        lines.append("-" * 65)
+        lines.append(f"  FAILURES ({len(all_failures)} total, showing first {min(len(all_failures), max_failures)}):")
+        lines.append("")
         
         for i, failure in enumerate(all_failures[:max_failures]):
-            print(format_failure(failure, show_code))
-            print()
+            lines.append(format_failure(failure, show_code))
+            lines.append("")
         
         if len(all_failures) > max_failures:
-            print(f"  ... and {len(all_failures) - max_failures} more failures")
+            lines.append(f"  ... and {len(all_failures) - max_failures} more failures")
     
     # Final summary
-    print("-" * 65)
+    lines.append("-" * 65)
     
     if total_failed == 0:
-        print(f"[OK] ALL {total_passed} TESTS PASSED")
+        lines.append(f"[OK] ALL {total_passed} TESTS PASSED")
     else:
-        print(f"[!!] {total_failed} FAILED, {total_passed} passed")
+        lines.append(f"[!!] {total_failed} FAILED, {total_passed} passed")
     
-    print(f"     time: {total_time/1000:.2f}s")
-    print("=" * 65)
-    print()
+    lines.append(f"     time: {total_time/1000:.2f}s")
+    lines.append("=" * 65)
+    lines.append("")
+    
+    # Emit the report in a single write
+    print('\n'.join(lines))
     
     return total_failed == 0
 
@@ -476,14 +490,7 @@ Examples:
     # Run suites
     suites = []
     for path in test_files:
-        suite = run_suite(path)
-        
-        # Filter results by name pattern
-        if args.filter:
-            suite.results = [
-                r for r in suite.results 
-                if fnmatch.fnmatch(r.name.lower(), f'*{args.filter.lower()}*')
-            ]
+        suite = run_suite(path, args.filter)
         
         if suite.results:  # Only add if has matching tests
             suites.append(suite)
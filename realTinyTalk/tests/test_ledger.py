@@ -0,0 +1,65 @@
+"""
+═══════════════════════════════════════════════════════════════
+LEDGER: hash-chain verification
+═══════════════════════════════════════════════════════════════
+"""
+
+import dataclasses
+
+from realTinyTalk.kernel import Ledger
+
+
+def _tamper(ledger: Ledger, pos: int, **changes):
+    ledger.entries[pos] = dataclasses.replace(ledger.entries[pos], **changes)
+
+
+def test_verify_chain_checks_every_link_by_default():
+    ledger = Ledger()
+    for i in range(5):
+        ledger.append('op', {'i': i}, {'ok': True})
+    assert ledger.verify_chain()
+
+    # Tampering with an entry that was already verified is still caught
+    _tamper(ledger, 1, hash='forged')
+    ledger.append('op', {'i': 5}, {'ok': True})
+    assert not ledger.verify_chain()
+
+
+def test_incremental_verify_checks_links_after_anchor():
+    ledger = Ledger()
+    for i in range(5):
+        ledger.append('op', {'i': i}, {'ok': True})
+    assert ledger.verify_chain(incremental=True)
+
+    ledger.append('op', {'i': 5}, {'ok': True})
+    assert ledger.verify_chain(incremental=True)
+
+    ledger.append('op', {'i': 6}, {'ok': True})
+    _tamper(ledger, -1, prev_hash='forged')
+    assert not ledger.verify_chain(incremental=True)
+
+
+def test_incremental_verify_rewalks_when_anchor_is_replaced():
+    ledger = Ledger()
+    for i in range(3):
+        ledger.append('op', {'i': i}, {'ok': True})
+    assert ledger.verify_chain(incremental=True)
+
+    # The anchor no longer matches, so the whole chain is re-checked
+    # and the older break is found
+    _tamper(ledger, 0, hash='forged')
+    _tamper(ledger, -1, hash='replaced')
+    assert not ledger.verify_chain(incremental=True)
+
+
+def test_bounded_ledger_evicts_oldest_entries():
+    ledger = Ledger(max_entries=3)
+    for i in range(10):
+        ledger.append('op', {'i': i}, {'ok': True})
+
+    assert len(ledger) == 3
+    # Indices keep counting past evicted entries
+    assert [e.index for e in ledger.entries] == [7, 8, 9]
+    # The oldest retained entry points at an evicted one, not GENESIS
+    assert ledger.entries[0].prev_hash != 'GENESIS'
+    assert ledger.verify_chain()
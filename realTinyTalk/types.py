@@ -190,7 +190,11 @@ class ValueType(Enum):
     ENUM_VARIANT = "enum_variant"
 
 
-@dataclass
+NUMERIC_TYPES = frozenset({ValueType.INT, ValueType.FLOAT})
+CONTAINER_TYPES = frozenset({ValueType.LIST, ValueType.MAP})
+
+
+@dataclass(slots=True)
 class Value:
     """Runtime value with type."""
     type: ValueType
@@ -211,11 +215,11 @@ class Value:
     
     @classmethod
     def bool_val(cls, b: bool) -> 'Value':
-        return cls(ValueType.BOOLEAN, bool(b))
+        return TRUE if b else FALSE
     
     @classmethod
     def null_val(cls) -> 'Value':
-        return cls(ValueType.NULL, None)
+        return NULL
     
     @classmethod
     def list_val(cls, items: List['Value']) -> 'Value':
@@ -272,6 +276,12 @@ class Value:
         return self.data
 
 
+# Values are never mutated in place, so null and the booleans are shared
+NULL = Value(ValueType.NULL, None)
+TRUE = Value(ValueType.BOOLEAN, True)
+FALSE = Value(ValueType.BOOLEAN, False)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # TYPE CHECKER
 # ═══════════════════════════════════════════════════════════════════════════════
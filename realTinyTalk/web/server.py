@@ -19,6 +19,7 @@ from realTinyTalk.runtime import TinyTalkError
 from pathlib import Path
 from datetime import datetime
 from difflib import SequenceMatcher
+from functools import lru_cache
 import hashlib
 import re
 from typing import Optional
@@ -38,11 +39,16 @@ STORAGE_ROOT.mkdir(parents=True, exist_ok=True)
 MAX_SCRIPT_BYTES = 100 * 1024  # 100 KB
 
 
+# Characters not allowed in user/project names and script filenames
+_UNSAFE_USER_RE = re.compile(r'[^A-Za-z0-9_\-]')
+_UNSAFE_NAME_RE = re.compile(r'[^A-Za-z0-9_\-.]')
+
+
 def _safe_user(name: str) -> str:
     if not name:
         return 'anonymous'
     # allow simple usernames, replace unsafe chars
-    name = re.sub(r'[^A-Za-z0-9_\-]', '-', name)
+    name = _UNSAFE_USER_RE.sub('-', name)
     name = name.strip('-')
     if len(name) > 32:
         name = name[:32]
@@ -70,7 +76,7 @@ def ensure_user_dirs():
 
 def _safe_name(name: str) -> str:
     # Keep only safe chars for filenames, enforce .tt
-    safe = re.sub(r'[^A-Za-z0-9_\-.]', '-', name)
+    safe = _UNSAFE_NAME_RE.sub('-', name)
     safe = safe.strip('-')
     if not safe:
         safe = 'untitled'
@@ -84,6 +90,13 @@ def _auth_path(username: str) -> Path:
     return STORAGE_ROOT / 'users' / username / 'auth.json'
 
 
+def _password_hash(salt: str, password: str) -> str:
+    """Salted SHA-256 of a password, fed to the hasher piecewise."""
+    h = hashlib.sha256(salt.encode('utf-8'))
+    h.update(password.encode('utf-8'))
+    return h.hexdigest()
+
+
 def _now_ts() -> str:
     """Return current UTC timestamp string."""
     return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
@@ -104,7 +117,7 @@ def register():
         return jsonify({'error': 'user exists'}), 400
     # create salted hash
     salt = os.urandom(16).hex()
-    h = hashlib.sha256((salt + password).encode('utf-8')).hexdigest()
+    h = _password_hash(salt, password)
     authp.write_text(json.dumps({'salt': salt, 'hash': h}))
     return jsonify({'created': uname})
 
@@ -123,7 +136,7 @@ def login():
     auth = json.loads(authp.read_text())
     salt = auth.get('salt')
     expected = auth.get('hash')
-    got = hashlib.sha256((salt + password).encode('utf-8')).hexdigest()
+    got = _password_hash(salt, password)
     if got != expected:
         return jsonify({'error': 'invalid credentials'}), 401
     session['user'] = uname
@@ -142,7 +155,7 @@ def logout():
 
 def _script_dir(name: str) -> Path:
     """Return the directory for a named script under the current user."""
-    safe = re.sub(r'[^A-Za-z0-9_\-.]', '-', name)
+    safe = _UNSAFE_NAME_RE.sub('-', name)
     return current_user_root() / 'scripts' / safe
 
 
@@ -167,6 +180,18 @@ def _latest_version(dirp: Path) -> Optional[dict]:
     return versions[-1] if versions else None
 
 
+def _too_large(code: str) -> bool:
+    """Return True if `code` exceeds MAX_SCRIPT_BYTES when UTF-8 encoded."""
+    # UTF-8 uses 1-4 bytes per character, so len() settles most cases
+    # without encoding the whole script.
+    n = len(code)
+    if n > MAX_SCRIPT_BYTES:
+        return True
+    if n * 4 <= MAX_SCRIPT_BYTES:
+        return False
+    return len(code.encode('utf-8')) > MAX_SCRIPT_BYTES
+
+
 def _save_version(dirp: Path, code: str, message: str = '') -> dict:
     """Save a new version of a script and return the version record."""
     dirp.mkdir(parents=True, exist_ok=True)
@@ -238,7 +263,7 @@ def save_script():
     code = data.get('code', '')
     message = data.get('message', '')
     # enforce size limits
-    if len(code.encode('utf-8')) > MAX_SCRIPT_BYTES:
+    if _too_large(code):
         return jsonify({'error': 'script too large'}), 400
     dirp = _script_dir(name)
     saved = _save_version(dirp, code, message)
@@ -256,7 +281,7 @@ def restore_script(name):
         return jsonify({'error': 'version not found'}), 404
     code = vpath.read_text()
     # enforce size
-    if len(code.encode('utf-8')) > MAX_SCRIPT_BYTES:
+    if _too_large(code):
         return jsonify({'error': 'version too large'}), 400
     saved = _save_version(dirp, code, f"restore:{vid}")
     return jsonify({'restored': saved})
@@ -296,7 +321,7 @@ def merge_script(name):
     message = data.get('message', 'merged from UI')
     if merged is None:
         return jsonify({'error': 'merged content required'}), 400
-    if len(merged.encode('utf-8')) > MAX_SCRIPT_BYTES:
+    if _too_large(merged):
         return jsonify({'error': 'merged too large'}), 400
     dirp = _script_dir(name)
     if not dirp.exists():
@@ -330,11 +355,9 @@ def find_ancestor(name):
     meta = _read_meta(dirp)
     versions = meta.get('versions', [])
     ids = [v['id'] for v in versions]
-    try:
-        i1 = ids.index(v1) if v1 in ids else None
-        i2 = ids.index(v2) if v2 in ids else None
-    except ValueError:
-        return jsonify({'error': 'version id not found'}), 404
+    positions = {vid: i for i, vid in enumerate(ids)}
+    i1 = positions.get(v1)
+    i2 = positions.get(v2)
     if i1 is None or i2 is None:
         return jsonify({'error': 'version id not found'}), 404
     base_idx = min(i1, i2) - 1
@@ -385,9 +408,10 @@ def _three_way_merge_lines(base, a, b):
                 continue
             if i2 <= start or i1 >= end:
                 continue
-            # overlap
-            overlap_start = max(i1, start)
-            overlap_end = min(i2, end)
+            # overlap (clamp the opcode range to [start, end]; conditional
+            # expressions avoid two builtin calls per opcode per range)
+            overlap_start = i1 if i1 > start else start
+            overlap_end = i2 if i2 < end else end
             if overlap_end > overlap_start:
                 off = overlap_start - i1
                 out.extend(target_lines[j1 + off: j1 + off + (overlap_end - overlap_start)])
@@ -396,7 +420,6 @@ def _three_way_merge_lines(base, a, b):
     # iterate ranges
     for k in range(len(bounds)-1):
         s = bounds[k]; e = bounds[k+1]
-        base_seg = base_lines[s:e]
         a_seg = collect_target_for_range(op_a, a_lines, s, e)
         b_seg = collect_target_for_range(op_b, b_lines, s, e)
 
@@ -404,11 +427,13 @@ def _three_way_merge_lines(base, a, b):
         if a_seg == b_seg:
             merged.extend(a_seg)
             continue
-        # If one side unchanged from base -> take the other
-        if a_seg == base_seg and b_seg != base_seg:
+        # If one side unchanged from base -> take the other (a_seg != b_seg
+        # here, so matching base already means the other side differs)
+        base_seg = base_lines[s:e]
+        if a_seg == base_seg:
             merged.extend(b_seg)
             continue
-        if b_seg == base_seg and a_seg != base_seg:
+        if b_seg == base_seg:
             merged.extend(a_seg)
             continue
         # If both differ from base and each other -> conflict
@@ -443,12 +468,13 @@ def merge_three_way(name):
     meta = _read_meta(dirp)
     versions = meta.get('versions', [])
     ids = [v['id'] for v in versions]
-    if v1 not in ids or v2 not in ids:
+    positions = {vid: i for i, vid in enumerate(ids)}
+    if v1 not in positions or v2 not in positions:
         return jsonify({'error': 'version id not found'}), 404
 
     if not base_id:
-        i1 = ids.index(v1)
-        i2 = ids.index(v2)
+        i1 = positions[v1]
+        i2 = positions[v2]
         base_idx = min(i1, i2) - 1
         if base_idx < 0:
             base_idx = 0
@@ -574,27 +600,40 @@ def run_code():
         })
 
 
+@lru_cache(maxsize=256)
+def _transpile(target: str, code: str, include_runtime: bool) -> str:
+    """Lex, parse and emit code for target ('js' or 'python').
+
+    Memoized because the IDE re-transpiles the same buffer every time the
+    user flips between output tabs; emitted source is an immutable str.
+    Callers must reject _too_large() code first so the cache stays bounded.
+    """
+    from realTinyTalk.lexer import Lexer
+    from realTinyTalk.parser import Parser
+
+    if target == 'js':
+        from realTinyTalk.backends.js.emitter import JSEmitter as Emitter
+    else:
+        from realTinyTalk.backends.python.emitter import PythonEmitter as Emitter
+
+    ast = Parser(Lexer(code).tokenize()).parse()
+    return Emitter(include_runtime=include_runtime).emit(ast)
+
+
 @app.route('/api/transpile/js', methods=['POST'])
 def transpile_to_js():
     """Transpile TinyTalk code to JavaScript."""
     data = request.get_json()
     code = data.get('code', '')
     include_runtime = data.get('include_runtime', True)
+    # keep oversized bodies out of the _transpile cache
+    if _too_large(code):
+        return jsonify({'error': 'script too large'}), 400
     
     start_time = time.time()
     
     try:
-        from realTinyTalk.lexer import Lexer
-        from realTinyTalk.parser import Parser
-        from realTinyTalk.backends.js.emitter import JSEmitter
-        
-        lexer = Lexer(code)
-        tokens = lexer.tokenize()
-        parser = Parser(tokens)
-        ast = parser.parse()
-        
-        emitter = JSEmitter(include_runtime=include_runtime)
-        js_code = emitter.emit(ast)
+        js_code = _transpile('js', code, bool(include_runtime))
         
         elapsed = (time.time() - start_time) * 1000
         
@@ -620,21 +659,14 @@ def transpile_to_python():
     data = request.get_json()
     code = data.get('code', '')
     include_runtime = data.get('include_runtime', True)
+    # keep oversized bodies out of the _transpile cache
+    if _too_large(code):
+        return jsonify({'error': 'script too large'}), 400
     
     start_time = time.time()
     
     try:
-        from realTinyTalk.lexer import Lexer
-        from realTinyTalk.parser import Parser
-        from realTinyTalk.backends.python.emitter import PythonEmitter
-        
-        lexer = Lexer(code)
-        tokens = lexer.tokenize()
-        parser = Parser(tokens)
-        ast = parser.parse()
-        
-        emitter = PythonEmitter(include_runtime=include_runtime)
-        py_code = emitter.emit(ast)
+        py_code = _transpile('python', code, bool(include_runtime))
         
         elapsed = (time.time() - start_time) * 1000
         
@@ -654,13 +686,12 @@ def transpile_to_python():
         })
 
 
-@app.route('/api/examples')
-def get_examples():
-    """Get example programs - using ultra-clean tinyTalk syntax."""
-    examples = [
-        {
-            'name': '👋 Hello World',
-            'code': '''// ═══════════════════════════════════════════════════════════
+# Example programs served to the IDE - using ultra-clean tinyTalk syntax.
+# Built once at import time; the payload never changes between requests.
+EXAMPLES = [
+    {
+        'name': '👋 Hello World',
+        'code': '''// ═══════════════════════════════════════════════════════════
 // Welcome to realTinyTalk!
 // The friendliest programming language
 // ═══════════════════════════════════════════════════════════
@@ -675,10 +706,10 @@ show("Welcome" name "to realTinyTalk!")
 show("Uppercase:" name.upcase)
 show("Length:" name.len)
 show("Reversed:" name.reversed)'''
-        },
-        {
-            'name': '📖 Tutorial: Basics',
-            'code': '''// ═══════════════════════════════════════
+    },
+    {
+        'name': '📖 Tutorial: Basics',
+        'code': '''// ═══════════════════════════════════════
 // TUTORIAL 1: The Basics
 // ═══════════════════════════════════════
 
@@ -710,10 +741,10 @@ show("Hello" name "!")
 show("Length:" name.len)
 show("Uppercase:" name.upcase)
 show("Reversed:" name.reversed)'''
-        },
-        {
-            'name': '📖 Tutorial: Functions',
-            'code': '''// ═══════════════════════════════════════
+    },
+    {
+        'name': '📖 Tutorial: Functions',
+        'code': '''// ═══════════════════════════════════════
 // TUTORIAL 2: Functions
 // ═══════════════════════════════════════
 
@@ -747,10 +778,10 @@ show("=== Factorials ===")
 for i in range(1, 8) {
     show(i.str + "! =" factorial(i))
 }'''
-        },
-        {
-            'name': '📖 Tutorial: Collections',
-            'code': '''// ═══════════════════════════════════════
+    },
+    {
+        'name': '📖 Tutorial: Collections',
+        'code': '''// ═══════════════════════════════════════
 // TUTORIAL 3: Lists & Maps
 // ═══════════════════════════════════════
 
@@ -784,10 +815,10 @@ show("City:" person.city)
 // Add to map
 person.country = "USA"
 show("Country:" person.country)'''
-        },
-        {
-            'name': '📖 Tutorial: Control Flow',
-            'code': '''// ═══════════════════════════════════════
+    },
+    {
+        'name': '📖 Tutorial: Control Flow',
+        'code': '''// ═══════════════════════════════════════
 // TUTORIAL 4: Control Flow
 // ═══════════════════════════════════════
 
@@ -825,10 +856,10 @@ for i in range(10) {
     if i > 7 { break }
     show(i)
 }'''
-        },
-        {
-            'name': '🔧 Property Magic',
-            'code': '''// Property conversions - no parentheses needed!
+    },
+    {
+        'name': '🔧 Property Magic',
+        'code': '''// Property conversions - no parentheses needed!
 // .str   -> convert to string
 // .int   -> convert to integer
 // .float -> convert to float  
@@ -863,10 +894,10 @@ show("first:" items.first)
 show("last:" items.last)
 show("empty:" items.empty)
 show("len:" items.len)'''
-        },
-        {
-            'name': '📜 when (Constants)',
-            'code': '''// WHEN - Declares immutable facts
+    },
+    {
+        'name': '📜 when (Constants)',
+        'code': '''// WHEN - Declares immutable facts
 // (Cannot be changed after creation)
 
 when PI = 3.14159
@@ -890,10 +921,10 @@ for r in range(1, 6) {
 
 // Try uncommenting this - you'll get an error!
 // PI = 3.0  // ERROR: Cannot reassign constant'''
-        },
-        {
-            'name': '🔨 forge (Actions)',
-            'code': '''// FORGE - Actions that can change state
+    },
+    {
+        'name': '🔨 forge (Actions)',
+        'code': '''// FORGE - Actions that can change state
 // Use when you need side effects
 
 forge greet(name)
@@ -912,10 +943,10 @@ end
 greet("World")
 show("")
 countdown(5)'''
-        },
-        {
-            'name': '⚖️ when/do/finfr (NEW!)',
-            'code': '''// The NEW way to define functions!
+    },
+    {
+        'name': '⚖️ when/do/finfr (NEW!)',
+        'code': '''// The NEW way to define functions!
 // when name(params)
 //   do expression
 // finfr  (fin for real!)
@@ -952,10 +983,10 @@ for i in range(1, 8) {
 when PI = 3.14159
 show("")
 show("PI =" PI)'''
-        },
-        {
-            'name': '⚖️ law/reply/end (classic)',
-            'code': '''// Classic function syntax (still works!)
+    },
+    {
+        'name': '⚖️ law/reply/end (classic)',
+        'code': '''// Classic function syntax (still works!)
 // law name(params)
 //   reply expression
 // end
@@ -977,10 +1008,10 @@ show("square(5):" square(5))
 show("factorial(6):" factorial(6))
 show("is_even(4):" is_even(4))
 show("is_even(7):" is_even(7))'''
-        },
-        {
-            'name': '🔢 Fibonacci',
-            'code': '''// Fibonacci - clean and simple
+    },
+    {
+        'name': '🔢 Fibonacci',
+        'code': '''// Fibonacci - clean and simple
 
 law fib(n)
     if n <= 1 { reply n }
@@ -991,10 +1022,10 @@ show("=== Fibonacci Sequence ===")
 for i in range(12) {
     show("fib(" i.str ") =" fib(i))
 }'''
-        },
-        {
-            'name': '🎯 FizzBuzz',
-            'code': '''// The classic interview question
+    },
+    {
+        'name': '🎯 FizzBuzz',
+        'code': '''// The classic interview question
 
 law fizzbuzz(n)
     if n % 15 == 0 { reply "FizzBuzz" }
@@ -1007,10 +1038,10 @@ show("=== FizzBuzz 1-20 ===")
 for i in range(1, 21) {
     show(fizzbuzz(i))
 }'''
-        },
-        {
-            'name': '🔍 Prime Numbers',
-            'code': '''// Find prime numbers
+    },
+    {
+        'name': '🔍 Prime Numbers',
+        'code': '''// Find prime numbers
 
 law is_prime(n)
     if n < 2 { reply false }
@@ -1030,10 +1061,10 @@ for n in range(2, 51) {
 show(primes)
 show("")
 show("Found" primes.len "primes")'''
-        },
-        {
-            'name': '📊 Quicksort',
-            'code': '''// Quicksort algorithm
+    },
+    {
+        'name': '📊 Quicksort',
+        'code': '''// Quicksort algorithm
 
 law quicksort(arr)
     if arr.len <= 1 { reply arr }
@@ -1056,10 +1087,10 @@ end
 let unsorted = [64, 34, 25, 12, 22, 11, 90]
 show("Unsorted:" unsorted)
 show("Sorted:" quicksort(unsorted))'''
-        },
-        {
-            'name': '🧮 Calculator',
-            'code': '''// Simple calculator with error handling
+    },
+    {
+        'name': '🧮 Calculator',
+        'code': '''// Simple calculator with error handling
 
 law add(a, b)
     reply a + b
@@ -1090,10 +1121,10 @@ show("10 / 5 =" result.value)
 
 let bad = divide(10, 0)
 show("10 / 0 =" bad.error)'''
-        },
-        {
-            'name': '🔗 Step Chains (NEW!)',
-            'code': '''// dplyr-style data manipulation
+    },
+    {
+        'name': '🔗 Step Chains (NEW!)',
+        'code': '''// dplyr-style data manipulation
 // Chain operations with _underscore steps!
 
 let numbers = [5, 2, 8, 1, 9, 3, 7, 4, 6]
@@ -1134,10 +1165,10 @@ end
 
 let result = numbers _filter(big) _sort _take(3)
 show("filter(>3) + sort + take(3):" result)'''
-        },
-        {
-            'name': '💬 Natural Comparisons',
-            'code': '''// Natural language comparisons!
+    },
+    {
+        'name': '💬 Natural Comparisons',
+        'code': '''// Natural language comparisons!
 // is, isnt, has, hasnt, isin, islike
 
 let name = "Alice"
@@ -1172,10 +1203,10 @@ show("Alice islike A*:" ("Alice" islike "A*"))
 show("Alice islike *ice:" ("Alice" islike "*ice"))
 show("Alice islike Al?ce:" ("Alice" islike "Al?ce"))
 show("Bob islike A*:" ("Bob" islike "A*"))'''
-        },
-        {
-            'name': '✨ String Properties',
-            'code': '''// String properties - no parentheses needed!
+    },
+    {
+        'name': '✨ String Properties',
+        'code': '''// String properties - no parentheses needed!
 
 let msg = "  Hello World  "
 
@@ -1201,10 +1232,10 @@ let words = sentence.words
 show("first 2 words:" words _take(2))
 show("sorted words:" words _sort)
 show("unique chars:" sentence.chars _unique _sort)'''
-        },
-        {
-            'name': '🏗️ Blueprints (OOP)',
-            'code': '''// Blueprints = Classes in realTinyTalk
+    },
+    {
+        'name': '🏗️ Blueprints (OOP)',
+        'code': '''// Blueprints = Classes in realTinyTalk
 // Define types with fields and methods
 
 blueprint Counter
@@ -1240,10 +1271,10 @@ show("After reset():" c.reset())
 let increment = c.inc
 show("Calling bound method:" increment())
 show("Again:" increment())'''
-        },
-        {
-            'name': '🔄 Higher-Order Functions',
-            'code': '''// Pass functions to other functions!
+    },
+    {
+        'name': '🔄 Higher-Order Functions',
+        'code': '''// Pass functions to other functions!
 
 let numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 
@@ -1296,9 +1327,16 @@ end
 
 show("apply_twice(doubled, 3):" apply_twice(doubled, 3))
 show("apply_twice(squared, 2):" apply_twice(squared, 2))'''
-        },
-    ]
-    return jsonify(examples)
+    },
+]
+
+_EXAMPLES_JSON = app.json.dumps(EXAMPLES).encode('utf-8')
+
+
+@app.route('/api/examples')
+def get_examples():
+    """Get example programs (pre-serialized at import)."""
+    return app.response_class(_EXAMPLES_JSON, mimetype='application/json')
 
 
 # ========== Projects API ===========
@@ -1326,7 +1364,7 @@ def create_project():
     name = data.get('name')
     if not name:
         return jsonify({'error': 'name required'}), 400
-    pname = re.sub(r'[^A-Za-z0-9_\-]', '-', Path(name).name)[:64]
+    pname = _UNSAFE_USER_RE.sub('-', Path(name).name)[:64]
     ensure_user_dirs()
     pdir = current_user_root() / 'projects' / pname
     pdir.mkdir(parents=True, exist_ok=True)
@@ -5,6 +5,18 @@ BASE = 'http://localhost:5555'
 
 s = requests.Session()
 
+def wait_for_server(timeout=5.0):
+    # Return as soon as the server answers instead of sleeping a fixed time
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            s.get(BASE + '/api/examples', timeout=0.5)
+            return
+        except requests.ConnectionError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.05)
+
 def try_register_login(user='intuser', pw='pass123'):
     r = s.post(BASE + '/api/register', json={'username': user, 'password': pw})
     print('register', r.status_code, r.text)
@@ -40,7 +52,7 @@ def project_flow():
     print('add script to project', r.status_code, r.text)
 
 if __name__ == '__main__':
-    time.sleep(0.5)
+    wait_for_server()
     try_register_login()
     save_script('itest.tt', 'show("hello from local")')
     list_scripts()
@@ -1,8 +1,12 @@
 import json
 import pytest
+
+pytest.importorskip('flask')
 from realTinyTalk.web import server
 
-@pytest.fixture
+# One client for the module; tests identify users via the X-User header,
+# so nothing carries over between them through the client itself.
+@pytest.fixture(scope='module')
 def client():
     server.app.config['TESTING'] = True
     with server.app.test_client() as c:
@@ -56,3 +60,31 @@ def test_save_list_get_delete(client):
     # ensure gone
     rv = client.get(f'/api/scripts/{name}', headers=headers)
     assert rv.status_code == 404
+
+
+def test_examples(client):
+    rv = client.get('/api/examples')
+    assert rv.status_code == 200
+    assert rv.mimetype == 'application/json'
+    arr = rv.get_json()
+    assert len(arr) == len(server.EXAMPLES)
+    assert all('name' in e and 'code' in e for e in arr)
+
+
+def test_too_large_counts_utf8_bytes():
+    limit = server.MAX_SCRIPT_BYTES
+    assert not server._too_large('a' * limit)
+    assert server._too_large('a' * (limit + 1))
+    # multi-byte characters push a short string over the byte limit
+    assert server._too_large('€' * (limit // 3 + 1))
+    assert not server._too_large('€' * (limit // 3))
+
+
+def test_transpile_rejects_oversized_code_before_caching(client):
+    code = 'a' * (server.MAX_SCRIPT_BYTES + 1)
+    before = server._transpile.cache_info().currsize
+    for target in ('js', 'python'):
+        rv = client.post(f'/api/transpile/{target}', json={'code': code})
+        assert rv.status_code == 400
+        assert rv.get_json() == {'error': 'script too large'}
+    assert server._transpile.cache_info().currsize == before